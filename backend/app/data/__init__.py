@@ -1,11 +1,12 @@
 """Data - Data access layer for file-based storage."""
 
-from app.data.file_handler import FileHandler, FileInfo, FileLock
+from app.data.file_handler import FileHandler, FileInfo, FileLock, OpenFile
 from app.data.yaml_handler import YAMLHandler
 
 __all__ = [
     "FileHandler",
     "FileInfo",
     "FileLock",
+    "OpenFile",
     "YAMLHandler",
 ]
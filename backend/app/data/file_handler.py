@@ -23,19 +23,31 @@ Example usage::
 """
 
 import asyncio
+import atexit
+import codecs
+import contextvars
+import errno
+import fnmatch
+import functools
 import logging
+import operator
 import os
+import re
 import shutil
+import socket
+import stat
 import threading
 import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import AsyncIterator, List
-
-import aiofiles
-import aiofiles.os
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, Union
+from uuid import uuid4
 
 from app.core.exceptions import (
     AppFileNotFoundError,
@@ -48,8 +60,214 @@ from app.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_R = TypeVar("_R")
+
+# Path argument accepted by the read/write/existence methods, which hand it
+# straight to os-level calls without wrapping it in a Path first.
+StrPath = Union[str, "os.PathLike[str]"]
+
+# Text larger than this is encoded and written in slices of this many characters,
+# so a multi-megabyte string never exists as a second, fully encoded copy.
+_WRITE_CHUNK_SIZE = 64 * 1024
+
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# os.open flags for whole-file reads
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# Files below this size are read with one os.read call, skipping FileIO setup
+# and the read-ahead hint, which only pays off for larger files.
+_SMALL_READ_SIZE = 64 * 1024
+
+# Read size for incremental reads: decoding larger text files and OpenFile.read()
+# to end of file
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# os.open flags for write_file/write_bytes, equivalent to open(path, "wb")
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# rmdir() reports a non-empty directory as ENOTEMPTY; POSIX also allows EEXIST
+_DIR_NOT_EMPTY_ERRNOS = frozenset({errno.ENOTEMPTY, errno.EEXIST})
+
+# os.open flags for the binary modes accepted by FileHandler.opened()
+_OPEN_MODE_FLAGS = {
+    "rb": os.O_RDONLY,
+    "wb": os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+    "ab": os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+    "r+b": os.O_RDWR,
+    "w+b": os.O_RDWR | os.O_CREAT | os.O_TRUNC,
+    "a+b": os.O_RDWR | os.O_CREAT | os.O_APPEND,
+}
+
+# Fallback poll interval for locks held by other processes. Releases within this
+# process wake waiters immediately via _notify_lock_released().
+_LOCK_POLL_INTERVAL = 0.05
+
+# Pending acquire_lock() waiters keyed by lock file, shared by all FileHandler
+# instances in the process. Futures may belong to different event loops.
+_lock_waiters: Dict[Path, Set["asyncio.Future[None]"]] = {}
+_lock_waiters_mutex = threading.Lock()
+
+_HOSTNAME = socket.gethostname()
+
+# Maximum number of FileInfo results remembered per FileHandler
+_FILE_INFO_CACHE_SIZE = 1024
+
+# Maximum number of directories remembered by _ensure_directory; the set is
+# simply cleared when full, at the cost of one extra mkdir per directory
+_KNOWN_DIRS_LIMIT = 10_000
+
+# Worker threads in the executor shared by all FileHandler instances. Blocking
+# file calls run there rather than in the event loop's default executor, so
+# they neither compete with other asyncio.to_thread users nor pay for a pool
+# per instance. The pool is shut down at exit and dropped in forked children
+# (e.g. pre-fork server workers), whose copy has no live threads.
+_FILE_IO_MAX_WORKERS = 32
+_file_io_executor: Optional[ThreadPoolExecutor] = None
+_file_io_executor_mutex = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> "re.Pattern[str]":
+    """Compile a single-component glob pattern to a regex, cached per pattern.
+
+    Matching is case-insensitive on Windows to mirror pathlib.Path.glob.
+    """
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+_GLOB_SPECIAL_CHARS = re.compile(r"[*?\[]")
+
+
+@lru_cache(maxsize=256)
+def _glob_matcher(pattern: str) -> Callable[[str], object]:
+    """Return a name matcher for a single-component glob pattern.
+
+    Literal names compare with ==, and plain ``*suffix`` (e.g. ``*.yaml``) and
+    ``prefix*`` (e.g. ``file_0.*``) patterns use str.endswith/str.startswith
+    instead of the regex engine. Windows always uses the regex, which handles
+    case-insensitivity.
+    """
+    if os.name != "nt":
+        if not _GLOB_SPECIAL_CHARS.search(pattern):
+            return pattern.__eq__
+        if pattern.startswith("*") and not _GLOB_SPECIAL_CHARS.search(pattern, 1):
+            return operator.methodcaller("endswith", pattern[1:])
+        if pattern.endswith("*") and not _GLOB_SPECIAL_CHARS.search(pattern, 0, len(pattern) - 1):
+            return operator.methodcaller("startswith", pattern[:-1])
+    return _compile_glob(pattern).match
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return whether a process with this PID exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to another user
+        return True
+    return True
+
+
+def _is_stale_lock(content: str) -> bool:
+    """Decide whether a lock file was left behind by a dead owner.
+
+    Lock files written by acquire_lock contain ``pid:hostname:epoch``. Only a
+    lock whose owner ran on this host can be proven dead, by probing its PID
+    (not on Windows, where os.kill cannot probe without terminating). Locks
+    from other hosts (e.g. containers sharing a volume) or without an owner
+    record are never broken, since age says nothing about a live holder.
+
+    Args:
+        content: Text content of the lock file.
+
+    Returns:
+        True if the lock can safely be broken.
+    """
+    pid_text, _, rest = content.partition(":")
+    hostname = rest.partition(":")[0]
+    if os.name != "nt" and hostname == _HOSTNAME and pid_text.isdigit():
+        return not _pid_alive(int(pid_text))
+    return False
+
+
+def _get_file_io_executor() -> ThreadPoolExecutor:
+    """Return the shared file I/O executor, creating it on first use."""
+    global _file_io_executor
+    if _file_io_executor is None:
+        with _file_io_executor_mutex:
+            if _file_io_executor is None:
+                _file_io_executor = ThreadPoolExecutor(
+                    max_workers=_FILE_IO_MAX_WORKERS,
+                    thread_name_prefix="file-io",
+                )
+    return _file_io_executor
+
+
+def _shutdown_file_io_executor() -> None:
+    """Shut down the shared file I/O executor, if one was created."""
+    global _file_io_executor
+    with _file_io_executor_mutex:
+        executor, _file_io_executor = _file_io_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _reset_file_io_executor_after_fork() -> None:
+    """Forget the parent's executor in a forked child so a fresh one is created."""
+    global _file_io_executor, _file_io_executor_mutex
+    _file_io_executor = None
+    # The parent may have held the mutex at fork time
+    _file_io_executor_mutex = threading.Lock()
+
+
+atexit.register(_shutdown_file_io_executor)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_file_io_executor_after_fork)
 
-@dataclass(frozen=True)
+
+async def _to_io_thread(func: Callable[..., _R], *args: Any) -> _R:
+    """Run func(*args) on the shared file I/O executor.
+
+    Equivalent to asyncio.to_thread(), including propagation of context
+    variables, but not tied to the event loop's default executor.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_get_file_io_executor(), functools.partial(ctx.run, func, *args))
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _wake_waiter(waiter: "asyncio.Future[None]") -> None:
+    """Resolve a lock waiter unless it already timed out."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _notify_lock_released(lock_file: Path) -> None:
+    """Wake all in-process waiters for a released lock file.
+
+    Waiters whose event loop has closed are skipped; nothing can await them.
+    """
+    with _lock_waiters_mutex:
+        waiters = _lock_waiters.pop(lock_file, set())
+    for waiter in waiters:
+        try:
+            waiter.get_loop().call_soon_threadsafe(_wake_waiter, waiter)
+        except RuntimeError:
+            # Loop closed between registering the waiter and this release
+            pass
+
+
+@dataclass(frozen=True, slots=True)
 class FileInfo:
     """Information about a file or directory.
 
@@ -85,18 +303,22 @@ class FileInfo:
             )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class FileLock:
     """Represents an acquired file lock.
 
     Attributes:
         path: The path to the locked file.
         acquired_at: When the lock was acquired.
+        owner: The ``pid:hostname:epoch`` record written to the lock file, so
+            release only removes a lock file this lock still owns. Empty for
+            locks not created by acquire_lock.
         lock_file: Path to the lock file (computed from path).
     """
 
     path: Path
     acquired_at: datetime
+    owner: str = ""
 
     @property
     def lock_file(self) -> Path:
@@ -108,6 +330,81 @@ class FileLock:
         return self.path.parent / f".{self.path.name}.lock"
 
 
+@dataclass(frozen=True, slots=True)
+class OpenFile:
+    """An open file descriptor with async read/write/seek.
+
+    Returned by FileHandler.opened(); each call runs one syscall loop in a
+    worker thread, so several operations on the same file share a single
+    open/close pair.
+
+    Attributes:
+        path: The path the descriptor was opened from.
+        fd: The raw OS file descriptor.
+    """
+
+    path: Path
+    fd: int
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes, or until end of file if size is negative.
+
+        Raises:
+            FileAccessError: If there's a permission error.
+            FileOperationError: For other file operation errors.
+        """
+        return await _to_io_thread(self._call, self._read_sync, size)
+
+    async def write(self, data: bytes) -> int:
+        """Write all of data at the current position.
+
+        Returns:
+            The number of bytes written (always len(data)).
+
+        Raises:
+            FileAccessError: If there's a permission error.
+            FileOperationError: For other file operation errors.
+        """
+        return await _to_io_thread(self._call, self._write_sync, data)
+
+    async def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Move the file position and return the new absolute position.
+
+        Raises:
+            FileOperationError: If the descriptor is not seekable.
+        """
+        return await _to_io_thread(self._call, os.lseek, self.fd, offset, whence)
+
+    def _read_sync(self, size: int) -> bytes:
+        """Synchronous implementation of read."""
+        if size >= 0:
+            return os.read(self.fd, size)
+        chunks: List[bytes] = []
+        while chunk := os.read(self.fd, _READ_CHUNK_SIZE):
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _write_sync(self, data: bytes) -> int:
+        """Synchronous implementation of write, retrying short writes."""
+        _write_all(self.fd, data)
+        return len(data)
+
+    def _call(self, func: Callable[..., _R], *args: object) -> _R:
+        """Run a descriptor syscall, mapping OS errors to AppException types."""
+        try:
+            return func(*args)
+        except PermissionError as e:
+            raise FileAccessError(
+                message=f"Permission denied accessing file: {self.path}",
+                details={"path": str(self.path), "error": str(e)},
+            ) from e
+        except OSError as e:
+            raise FileOperationError(
+                message=f"Error accessing file: {self.path}",
+                details={"path": str(self.path), "error": str(e)},
+            ) from e
+
+
 class FileHandler:
     """Handles file system operations with async support and file locking.
 
@@ -118,8 +415,8 @@ class FileHandler:
         - Getting file information and metadata
 
     All file operations are performed with UTF-8 encoding by default.
-    Async operations use aiofiles for true async I/O on file read/write,
-    and asyncio.to_thread for other filesystem operations (stat, mkdir, etc.).
+    Async operations run their blocking filesystem calls in a worker thread
+    of a shared file I/O executor, one dispatch per operation.
 
     Example usage::
 
@@ -129,21 +426,41 @@ class FileHandler:
         await handler.write_file(Path("output.txt"), content)
     """
 
-    def __init__(self) -> None:
-        """Initialize the FileHandler."""
+    def __init__(self, track_cache_stats: bool = False) -> None:
+        """Initialize the FileHandler.
+
+        Args:
+            track_cache_stats: If True, count get_file_info() cache hits and
+                misses for get_cache_stats(). Off by default.
+        """
         self._encoding = "utf-8"
-        self._active_locks: dict[Path, FileLock] = {}
+        # Held locks by path. Values are weak so a lock the caller drops without
+        # releasing does not stay pinned here for the handler's lifetime.
+        self._active_locks: "weakref.WeakValueDictionary[Path, FileLock]" = weakref.WeakValueDictionary()
         self._locks_mutex = threading.Lock()
+        # Directories this handler has already created or seen, so repeated
+        # writes into the same directory skip the mkdir syscall. Worker threads
+        # share it, hence the mutex.
+        self._known_dirs: set[str] = set()
+        self._known_dirs_mutex = threading.Lock()
+        # Recent get_file_info() results as path -> (stat signature, info), in
+        # least-recently-used order. Worker threads share it, hence the mutex.
+        self._info_cache: "OrderedDict[Path, Tuple[Tuple[int, int, int, int], FileInfo]]" = OrderedDict()
+        self._info_cache_mutex = threading.Lock()
+        self._track_cache_stats = track_cache_stats
+        self._info_cache_stats: Dict[str, int] = {"hits": 0, "cold_misses": 0, "stale_misses": 0}
 
     # =========================================================================
     # File Read Operations
     # =========================================================================
 
-    async def read_file(self, path: Path) -> str:
+    async def read_file(self, path: StrPath) -> str:
         """Read text content from a file.
 
-        Uses aiofiles for true async I/O. Uses try/except pattern instead of
-        exists() check to avoid TOCTOU race condition.
+        The file is read and decoded in a worker thread (see _read_text_sync),
+        with universal newline translation as in text-mode open(). Uses
+        try/except pattern instead of exists() check to avoid TOCTOU race
+        condition.
 
         Args:
             path: Path to the file to read.
@@ -158,9 +475,7 @@ class FileHandler:
                 encoding errors for non-UTF-8 files).
         """
         try:
-            async with aiofiles.open(path, "r", encoding=self._encoding) as f:
-                content: str = await f.read()
-                return content
+            return await _to_io_thread(self._read_text_sync, path)
         except FileNotFoundError:
             raise AppFileNotFoundError(
                 message=f"File not found: {path}",
@@ -182,11 +497,12 @@ class FileHandler:
                 details={"path": str(path), "error": str(e)},
             ) from e
 
-    async def read_bytes(self, path: Path) -> bytes:
+    async def read_bytes(self, path: StrPath) -> bytes:
         """Read binary content from a file.
 
-        Uses aiofiles for true async I/O. Uses try/except pattern instead of
-        exists() check to avoid TOCTOU race condition.
+        Reads the whole file in a worker thread (see _read_bytes_sync). Uses
+        try/except pattern instead of exists() check to avoid TOCTOU race
+        condition.
 
         Args:
             path: Path to the file to read.
@@ -200,9 +516,7 @@ class FileHandler:
             FileOperationError: For other file operation errors.
         """
         try:
-            async with aiofiles.open(path, "rb") as f:
-                content: bytes = await f.read()
-                return content
+            return await _to_io_thread(self._read_bytes_sync, path)
         except FileNotFoundError:
             raise AppFileNotFoundError(
                 message=f"File not found: {path}",
@@ -219,15 +533,92 @@ class FileHandler:
                 details={"path": str(path), "error": str(e)},
             ) from e
 
+    def _read_bytes_sync(self, path: StrPath) -> bytes:
+        """Read a whole file in as few syscalls as possible (see _read_fd_sync)."""
+        fd = os.open(path, _READ_FLAGS)
+        try:
+            return self._read_fd_sync(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+
+    def _read_fd_sync(self, fd: int, size: int) -> bytes:
+        """Read an open file descriptor to end of file.
+
+        Files smaller than _SMALL_READ_SIZE are read with a single os.read of
+        their fstat size plus one byte; a short read means end of file, so
+        open/fstat/read/close is the whole cost. Larger files (and files that
+        turn out longer than fstat reported, such as /proc entries) finish
+        with FileIO.readall(), after telling the kernel on POSIX that the file
+        will be read sequentially (POSIX_FADV_SEQUENTIAL) to enlarge read-ahead.
+        """
+        if size < _SMALL_READ_SIZE:
+            head = os.read(fd, size + 1)
+            if len(head) <= size:
+                return head
+        else:
+            head = b""
+            if _HAS_FADVISE:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with os.fdopen(fd, "rb", buffering=0, closefd=False) as f:
+            return head + f.readall()
+
+    def _read_text_sync(self, path: StrPath) -> str:
+        """Read and decode a text file, translating newlines like open(..., "r").
+
+        Small files are read and decoded in one go. Larger files are decoded
+        chunk by chunk as they are read (see _decode_fd_sync), so a file that
+        is not valid UTF-8 fails at the first bad chunk instead of after being
+        loaded whole.
+        """
+        fd = os.open(path, _READ_FLAGS)
+        try:
+            size = os.fstat(fd).st_size
+            if size < _SMALL_READ_SIZE:
+                content = self._read_fd_sync(fd, size).decode(self._encoding)
+            else:
+                content = self._decode_fd_sync(fd)
+        finally:
+            os.close(fd)
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    def _decode_fd_sync(self, fd: int) -> str:
+        """Read and incrementally decode an open file descriptor to end of file.
+
+        Raises:
+            UnicodeDecodeError: At the first undecodable byte; the reason
+                includes its offset within the file.
+        """
+        if _HAS_FADVISE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        decoder = codecs.getincrementaldecoder(self._encoding)()
+        parts: List[str] = []
+        offset = 0
+        while True:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+            # Bytes of an incomplete character carried over from the last chunk
+            pending = len(decoder.getstate()[0])
+            try:
+                parts.append(decoder.decode(chunk, final=not chunk))
+            except UnicodeDecodeError as e:
+                raise UnicodeDecodeError(
+                    e.encoding, e.object, e.start, e.end, f"{e.reason} at file offset {offset - pending + e.start}"
+                ) from None
+            if not chunk:
+                return "".join(parts)
+            offset += len(chunk)
+
     # =========================================================================
     # File Write Operations
     # =========================================================================
 
-    async def write_file(self, path: Path, content: str) -> None:
+    async def write_file(self, path: StrPath, content: str) -> None:
         """Write text content to a file.
 
-        Creates parent directories if they don't exist.
-        Uses aiofiles for true async I/O.
+        Creates parent directories if they don't exist. The file is opened,
+        written and closed in one worker-thread call (see _write_text_sync),
+        with newlines translated as in text-mode open().
 
         Note:
             If the file already exists, it will be completely overwritten.
@@ -243,10 +634,9 @@ class FileHandler:
             FileOperationError: For other file operation errors.
         """
         try:
-            # Create parent directories if needed (sync, but quick)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            async with aiofiles.open(path, "w", encoding=self._encoding) as f:
-                await f.write(content)
+            await _to_io_thread(
+                self._call_in_directory_sync, os.path.dirname(os.fspath(path)), self._write_text_sync, path, content
+            )
         except PermissionError as e:
             raise FileAccessError(
                 message=f"Permission denied writing file: {path}",
@@ -258,11 +648,11 @@ class FileHandler:
                 details={"path": str(path), "error": str(e)},
             ) from e
 
-    async def write_bytes(self, path: Path, content: bytes) -> None:
+    async def write_bytes(self, path: StrPath, content: bytes) -> None:
         """Write binary content to a file.
 
-        Creates parent directories if they don't exist.
-        Uses aiofiles for true async I/O.
+        Creates parent directories if they don't exist. The file is opened,
+        written and closed in one worker-thread call (see _write_bytes_sync).
 
         Note:
             If the file already exists, it will be completely overwritten.
@@ -278,10 +668,9 @@ class FileHandler:
             FileOperationError: For other file operation errors.
         """
         try:
-            # Create parent directories if needed (sync, but quick)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            async with aiofiles.open(path, "wb") as f:
-                await f.write(content)
+            await _to_io_thread(
+                self._call_in_directory_sync, os.path.dirname(os.fspath(path)), self._write_bytes_sync, path, content
+            )
         except PermissionError as e:
             raise FileAccessError(
                 message=f"Permission denied writing file: {path}",
@@ -293,6 +682,169 @@ class FileHandler:
                 details={"path": str(path), "error": str(e)},
             ) from e
 
+    def _write_bytes_sync(self, path: StrPath, content: bytes) -> None:
+        """Write a whole file with a single write syscall where the OS allows."""
+        fd = os.open(path, _WRITE_FLAGS, 0o666)
+        try:
+            _write_all(fd, content)
+        finally:
+            os.close(fd)
+
+    def _write_text_sync(self, path: StrPath, content: str) -> None:
+        """Encode and write a text file, translating newlines like open(..., "w").
+
+        Content up to _WRITE_CHUNK_SIZE characters is encoded once and written
+        in one call; larger content is encoded and written slice by slice so a
+        second, fully encoded copy never exists.
+        """
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        fd = os.open(path, _WRITE_FLAGS, 0o666)
+        try:
+            if len(content) <= _WRITE_CHUNK_SIZE:
+                _write_all(fd, content.encode(self._encoding))
+            else:
+                for start in range(0, len(content), _WRITE_CHUNK_SIZE):
+                    _write_all(fd, content[start : start + _WRITE_CHUNK_SIZE].encode(self._encoding))
+        finally:
+            os.close(fd)
+
+    def _ensure_directory(self, directory: str) -> None:
+        """Create a directory and its parents unless already known to exist.
+
+        Blocking; call it from a worker thread. Directories removed through
+        `delete_directory` are forgotten; removal by other means is caught by
+        _call_in_directory_sync's retry.
+
+        Args:
+            directory: Directory that must exist.
+
+        Raises:
+            OSError: If the directory cannot be created.
+        """
+        key = os.path.normpath(directory)
+        with self._known_dirs_mutex:
+            if key in self._known_dirs:
+                return
+        Path(key).mkdir(parents=True, exist_ok=True)
+        with self._known_dirs_mutex:
+            if len(self._known_dirs) >= _KNOWN_DIRS_LIMIT:
+                self._known_dirs.clear()
+            self._known_dirs.add(key)
+
+    def _call_in_directory_sync(self, directory: str, func: Callable[..., _R], *args: Any) -> _R:
+        """Ensure directory exists, then run a blocking call that creates an entry in it.
+
+        If the call fails with FileNotFoundError because the cached directory
+        was removed behind this handler's back (another handler or process),
+        the cache entry is dropped, the directory recreated and the call
+        retried once.
+
+        Args:
+            directory: Directory the call writes into.
+            func: Blocking function to run.
+            *args: Arguments for func.
+
+        Returns:
+            The result of func.
+        """
+        self._ensure_directory(directory)
+        try:
+            return func(*args)
+        except FileNotFoundError:
+            key = os.path.normpath(directory)
+            if os.path.isdir(key):
+                raise
+            with self._known_dirs_mutex:
+                self._known_dirs.discard(key)
+            self._ensure_directory(key)
+            return func(*args)
+
+    def _forget_directory(self, directory: Path) -> None:
+        """Drop a directory and everything below it from the known-dirs cache."""
+        key = os.path.normpath(directory)
+        prefix = key.rstrip(os.sep) + os.sep
+        with self._known_dirs_mutex:
+            self._known_dirs.difference_update([d for d in self._known_dirs if d == key or d.startswith(prefix)])
+
+    async def write_many(self, items: Iterable[Tuple[Path, str]]) -> None:
+        """Write text content to several files concurrently.
+
+        Each write runs as an independent write_file() call, so the thread
+        pool can overlap them instead of awaiting one at a time.
+
+        Note:
+            Writes are not atomic as a group. If one fails, the first error is
+            raised and the remaining writes still run to completion.
+
+        Args:
+            items: Pairs of (path, content) to write.
+
+        Raises:
+            FileAccessError: If there's a permission error.
+            FileOperationError: For other file operation errors.
+        """
+        await asyncio.gather(*(self.write_file(path, content) for path, content in items))
+
+    @asynccontextmanager
+    async def opened(self, path: Path, mode: str = "rb") -> AsyncIterator[OpenFile]:
+        """Open a file once for several reads/writes.
+
+        Use this instead of repeated read_bytes()/write_bytes() calls on the
+        same file to avoid an open/close pair per operation. Write modes
+        create parent directories like write_bytes().
+
+        Args:
+            path: Path to the file to open.
+            mode: One of "rb", "wb", "ab", "r+b", "w+b", "a+b".
+
+        Yields:
+            OpenFile wrapping the descriptor; it is closed on exit.
+
+        Raises:
+            ValueError: If mode is not supported.
+            AppFileNotFoundError: If the file does not exist (read modes).
+            FileAccessError: If there's a permission error.
+            FileOperationError: For other file operation errors.
+
+        Example usage::
+
+            async with handler.opened(Path("data.bin"), "w+b") as f:
+                await f.write(b"payload")
+                await f.seek(0)
+                data = await f.read()
+        """
+        try:
+            flags = _OPEN_MODE_FLAGS[mode] | getattr(os, "O_BINARY", 0)
+        except KeyError:
+            raise ValueError(f"Unsupported mode {mode!r}; expected one of {sorted(_OPEN_MODE_FLAGS)}") from None
+        try:
+            if flags & os.O_CREAT:
+                fd = await _to_io_thread(
+                    self._call_in_directory_sync, os.fspath(path.parent), os.open, path, flags, 0o666
+                )
+            else:
+                fd = await _to_io_thread(os.open, path, flags, 0o666)
+        except FileNotFoundError:
+            raise AppFileNotFoundError(
+                message=f"File not found: {path}",
+                details={"path": str(path)},
+            )
+        except PermissionError as e:
+            raise FileAccessError(
+                message=f"Permission denied opening file: {path}",
+                details={"path": str(path), "error": str(e)},
+            ) from e
+        except OSError as e:
+            raise FileOperationError(
+                message=f"Error opening file: {path}",
+                details={"path": str(path), "error": str(e)},
+            ) from e
+        try:
+            yield OpenFile(path=path, fd=fd)
+        finally:
+            await _to_io_thread(os.close, fd)
+
     # =========================================================================
     # File Delete Operations
     # =========================================================================
@@ -310,7 +862,7 @@ class FileHandler:
             FileAccessError: If there's a permission error.
             FileOperationError: For other file operation errors.
         """
-        return await asyncio.to_thread(self._delete_file_sync, path)
+        return await _to_io_thread(self._delete_file_sync, path)
 
     def _delete_file_sync(self, path: Path) -> bool:
         """Synchronous implementation of delete_file.
@@ -344,6 +896,9 @@ class FileHandler:
 
         Creates parent directories of destination if they don't exist.
         Uses try/except pattern to avoid TOCTOU race condition.
+        The copy is done by shutil.copy2, which uses zero-copy syscalls
+        (os.sendfile / copy_file_range on Linux, fcopyfile on macOS) so file
+        data never passes through Python buffers.
 
         Note:
             If the destination file already exists, it will be completely overwritten.
@@ -361,7 +916,7 @@ class FileHandler:
         """
         try:
             # Create parent directories if needed
-            destination.parent.mkdir(parents=True, exist_ok=True)
+            await _to_io_thread(self._ensure_directory, os.fspath(destination.parent))
         except PermissionError as e:
             raise FileAccessError(
                 message=f"Permission denied creating destination directory: {destination.parent}",
@@ -375,7 +930,9 @@ class FileHandler:
 
         try:
             # Use shutil.copy2 to preserve metadata
-            await asyncio.to_thread(shutil.copy2, source, destination)
+            await _to_io_thread(
+                self._call_in_directory_sync, os.fspath(destination.parent), shutil.copy2, source, destination
+            )
         except FileNotFoundError:
             raise AppFileNotFoundError(
                 message=f"Source file not found: {source}",
@@ -397,6 +954,9 @@ class FileHandler:
 
         Creates parent directories of destination if they don't exist.
         Uses try/except pattern to avoid TOCTOU race condition.
+        On the same filesystem the move is a single os.replace (a rename, no
+        data copy); across filesystems it falls back to shutil.move. If
+        destination is an existing directory, the file is moved into it.
 
         Note:
             If the destination file already exists, it will be completely overwritten.
@@ -414,7 +974,7 @@ class FileHandler:
         """
         try:
             # Create parent directories if needed
-            destination.parent.mkdir(parents=True, exist_ok=True)
+            await _to_io_thread(self._ensure_directory, os.fspath(destination.parent))
         except PermissionError as e:
             raise FileAccessError(
                 message=f"Permission denied creating destination directory: {destination.parent}",
@@ -427,8 +987,9 @@ class FileHandler:
             ) from e
 
         try:
-            # Use shutil.move for cross-filesystem moves
-            await asyncio.to_thread(shutil.move, str(source), str(destination))
+            await _to_io_thread(
+                self._call_in_directory_sync, os.fspath(destination.parent), self._move_file_sync, source, destination
+            )
         except FileNotFoundError:
             raise AppFileNotFoundError(
                 message=f"Source file not found: {source}",
@@ -445,11 +1006,26 @@ class FileHandler:
                 details={"source": str(source), "destination": str(destination), "error": str(e)},
             ) from e
 
+    def _move_file_sync(self, source: Path, destination: Path) -> None:
+        """Rename source over destination, copying only across filesystems.
+
+        Like shutil.move, an existing directory as destination receives the
+        file under its own name.
+        """
+        if destination.is_dir():
+            destination = destination / source.name
+        try:
+            os.replace(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source), str(destination))
+
     # =========================================================================
     # File Existence Operations
     # =========================================================================
 
-    async def file_exists(self, path: Path) -> bool:
+    async def file_exists(self, path: StrPath) -> bool:
         """Check if a file exists.
 
         Args:
@@ -458,11 +1034,57 @@ class FileHandler:
         Returns:
             True if the path exists and is a file, False otherwise.
         """
-        return await asyncio.to_thread(self._file_exists_sync, path)
+        return await _to_io_thread(self._file_exists_sync, path)
+
+    def _file_exists_sync(self, path: StrPath) -> bool:
+        """Synchronous implementation of file_exists (a single stat call)."""
+        return os.path.isfile(path)
 
-    def _file_exists_sync(self, path: Path) -> bool:
-        """Synchronous implementation of file_exists."""
-        return path.exists() and path.is_file()
+    async def files_exist(self, paths: Iterable[Path]) -> Dict[Path, bool]:
+        """Check whether several files exist.
+
+        Paths are grouped by parent directory and each parent is listed once
+        with os.scandir, so sibling files cost one directory read instead of
+        one stat call each. Names missing from the listing are re-checked with
+        a stat, so results match file_exists() on case-insensitive
+        filesystems, where the listing's exact spelling may differ.
+
+        Args:
+            paths: Paths to check.
+
+        Returns:
+            Mapping of each path to True if it exists and is a file (symlinks
+            are followed, as in file_exists), False otherwise.
+        """
+        return await _to_io_thread(self._files_exist_sync, list(paths))
+
+    def _files_exist_sync(self, paths: List[Path]) -> Dict[Path, bool]:
+        """Synchronous implementation of files_exist."""
+        by_parent: Dict[Path, List[Path]] = {}
+        for path in paths:
+            by_parent.setdefault(path.parent, []).append(path)
+
+        result: Dict[Path, bool] = {}
+        for parent, children in by_parent.items():
+            if len(children) == 1:
+                result[children[0]] = os.path.isfile(children[0])
+                continue
+            try:
+                with os.scandir(parent) as entries:
+                    file_names = {entry.name for entry in entries if entry.is_file()}
+            except FileNotFoundError:
+                for child in children:
+                    result[child] = False
+                continue
+            except OSError:
+                # The directory may be searchable but not listable; check each path
+                for child in children:
+                    result[child] = os.path.isfile(child)
+                continue
+            for child in children:
+                # A miss may be a case-only mismatch on a case-insensitive filesystem
+                result[child] = child.name in file_names or os.path.isfile(child)
+        return result
 
     # =========================================================================
     # Directory Operations
@@ -484,7 +1106,7 @@ class FileHandler:
             FileOperationError: For other file operation errors, including
                 missing parent directories when parents=False.
         """
-        await asyncio.to_thread(self._create_directory_sync, path, parents)
+        await _to_io_thread(self._create_directory_sync, path, parents)
 
     def _create_directory_sync(self, path: Path, parents: bool) -> None:
         """Synchronous implementation of create_directory."""
@@ -518,7 +1140,7 @@ class FileHandler:
             ValueError: If the pattern contains unsafe path traversal sequences.
         """
         self._validate_glob_pattern(pattern)
-        return await asyncio.to_thread(self._list_directory_sync, path, pattern)
+        return await _to_io_thread(self._list_directory_sync, path, pattern)
 
     def _validate_glob_pattern(self, pattern: str) -> None:
         """Validate glob pattern is safe and well-formed.
@@ -542,22 +1164,77 @@ class FileHandler:
         if len(pattern) >= 2 and pattern[1] == ":" and pattern[0].isalpha():
             raise ValueError("Glob pattern cannot contain drive letters for security reasons")
 
+    async def list_directory_grouped(self, path: Path, patterns: Iterable[str]) -> Dict[str, List[Path]]:
+        """List a directory once and group its entries by several patterns.
+
+        Equivalent to calling list_directory() for each pattern, but all
+        single-component patterns share one os.scandir pass. An entry that
+        matches several patterns appears in each of their lists.
+
+        Args:
+            path: Path to the directory to list.
+            patterns: Glob patterns to group results by.
+
+        Returns:
+            Mapping of each pattern to the paths matching it.
+
+        Raises:
+            DirectoryNotFoundError: If the directory does not exist.
+            FileAccessError: If there's a permission error.
+            FileOperationError: For other file operation errors.
+            ValueError: If a pattern contains unsafe path traversal sequences.
+        """
+        unique_patterns = list(dict.fromkeys(patterns))
+        for pattern in unique_patterns:
+            self._validate_glob_pattern(pattern)
+        return await _to_io_thread(self._list_directory_grouped_sync, path, unique_patterns)
+
     def _list_directory_sync(self, path: Path, pattern: str) -> List[Path]:
         """Synchronous implementation of list_directory."""
-        if not path.exists():
+        return self._list_directory_grouped_sync(path, [pattern])[pattern]
+
+    def _list_directory_grouped_sync(self, path: Path, patterns: List[str]) -> Dict[str, List[Path]]:
+        """Synchronous implementation of list_directory_grouped.
+
+        Single-component patterns are matched in one os.scandir pass, which
+        also reports missing paths and non-directories without extra stat calls.
+        """
+        grouped: Dict[str, List[Path]] = {pattern: [] for pattern in patterns}
+        simple = [
+            (pattern, _glob_matcher(pattern))
+            for pattern in patterns
+            if pattern and "**" not in pattern and "/" not in pattern and os.sep not in pattern
+        ]
+        try:
+            if simple:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        for pattern, matches in simple:
+                            if matches(entry.name):
+                                grouped[pattern].append(Path(entry.path))
+                if len(simple) == len(patterns):
+                    return grouped
+
+            # Recursive or multi-component patterns need pathlib's walker, which
+            # yields nothing (instead of raising) for a missing directory. A
+            # successful scandir above already proved the directory exists.
+            if not simple and not stat.S_ISDIR(path.stat().st_mode):
+                raise NotADirectoryError(path)
+            simple_patterns = {pattern for pattern, _ in simple}
+            for pattern in patterns:
+                if pattern not in simple_patterns:
+                    grouped[pattern] = list(path.glob(pattern))
+            return grouped
+        except FileNotFoundError:
             raise DirectoryNotFoundError(
                 message=f"Directory not found: {path}",
                 details={"path": str(path)},
             )
-
-        if not path.is_dir():
+        except NotADirectoryError:
             raise DirectoryNotFoundError(
                 message=f"Path is not a directory: {path}",
                 details={"path": str(path)},
             )
-
-        try:
-            return list(path.glob(pattern))
         except PermissionError as e:
             raise FileAccessError(
                 message=f"Permission denied listing directory: {path}",
@@ -585,39 +1262,43 @@ class FileHandler:
             FileAccessError: If there's a permission error.
             FileOperationError: For other file operation errors.
         """
-        return await asyncio.to_thread(self._delete_directory_sync, path, recursive)
+        return await _to_io_thread(self._delete_directory_sync, path, recursive)
 
     def _delete_directory_sync(self, path: Path, recursive: bool) -> bool:
-        """Synchronous implementation of delete_directory."""
-        if not path.exists():
-            return False
+        """Synchronous implementation of delete_directory.
 
+        The non-recursive case lets rmdir() decide emptiness, so it costs one
+        syscall instead of an exists() stat plus a directory listing.
+        Cached directories are forgotten only once the directory is gone, so an
+        entry re-added by a concurrent write during the delete is not left stale.
+        """
         try:
             if recursive:
                 shutil.rmtree(path)
             else:
-                # Check if directory is empty
-                if any(path.iterdir()):
-                    raise DirectoryNotEmptyError(
-                        message=f"Directory is not empty: {path}",
-                        details={"path": str(path)},
-                    )
                 path.rmdir()
-            return True
-        except DirectoryNotEmptyError:
-            raise
+        except FileNotFoundError:
+            self._forget_directory(path)
+            return False
         except PermissionError as e:
             raise FileAccessError(
                 message=f"Permission denied deleting directory: {path}",
                 details={"path": str(path), "error": str(e)},
             ) from e
         except OSError as e:
+            if e.errno in _DIR_NOT_EMPTY_ERRNOS:
+                raise DirectoryNotEmptyError(
+                    message=f"Directory is not empty: {path}",
+                    details={"path": str(path)},
+                ) from e
             raise FileOperationError(
                 message=f"Error deleting directory: {path}",
                 details={"path": str(path), "error": str(e)},
             ) from e
+        self._forget_directory(path)
+        return True
 
-    async def directory_exists(self, path: Path) -> bool:
+    async def directory_exists(self, path: StrPath) -> bool:
         """Check if a directory exists.
 
         Args:
@@ -626,11 +1307,11 @@ class FileHandler:
         Returns:
             True if the path exists and is a directory, False otherwise.
         """
-        return await asyncio.to_thread(self._directory_exists_sync, path)
+        return await _to_io_thread(self._directory_exists_sync, path)
 
-    def _directory_exists_sync(self, path: Path) -> bool:
-        """Synchronous implementation of directory_exists."""
-        return path.exists() and path.is_dir()
+    def _directory_exists_sync(self, path: StrPath) -> bool:
+        """Synchronous implementation of directory_exists (a single stat call)."""
+        return os.path.isdir(path)
 
     # =========================================================================
     # File Info Operations
@@ -650,37 +1331,30 @@ class FileHandler:
             FileAccessError: If there's a permission error.
             FileOperationError: For other file operation errors.
         """
-        return await asyncio.to_thread(self._get_file_info_sync, path)
+        return await _to_io_thread(self._get_file_info_sync, path)
 
     def _get_file_info_sync(self, path: Path) -> FileInfo:
         """Synchronous implementation of get_file_info.
 
+        Results are cached per path and reused while the entry's st_mtime_ns,
+        st_ctime_ns, st_size and st_ino are unchanged. Size and inode guard
+        against filesystems with coarse timestamps, where two writes within
+        one tick leave the times equal. Everything is derived from a single
+        stat call (following symlinks, like Path.is_file/is_dir), which is
+        never skipped.
+
         Note:
             The created_at field uses st_ctime which represents:
             - On Windows: The actual file creation time
             - On Unix/Linux: The last metadata change time (inode change)
         """
-        if not path.exists():
+        try:
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise AppFileNotFoundError(
                 message=f"Path not found: {path}",
                 details={"path": str(path)},
             )
-
-        try:
-            stat = path.stat()
-
-            # Convert timestamps to datetime
-            created_at = datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc)
-            modified_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-
-            return FileInfo(
-                path=path,
-                size=stat.st_size if path.is_file() else 0,
-                created_at=created_at,
-                modified_at=modified_at,
-                is_file=path.is_file(),
-                is_directory=path.is_dir(),
-            )
         except PermissionError as e:
             raise FileAccessError(
                 message=f"Permission denied getting file info: {path}",
@@ -692,6 +1366,47 @@ class FileHandler:
                 details={"path": str(path), "error": str(e)},
             ) from e
 
+        signature = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+        with self._info_cache_mutex:
+            cached = self._info_cache.get(path)
+            if cached is not None and cached[0] == signature:
+                self._info_cache.move_to_end(path)
+                if self._track_cache_stats:
+                    self._info_cache_stats["hits"] += 1
+                return cached[1]
+            if self._track_cache_stats:
+                self._info_cache_stats["cold_misses" if cached is None else "stale_misses"] += 1
+
+        is_file = stat.S_ISREG(st.st_mode)
+        info = FileInfo(
+            path=path,
+            size=st.st_size if is_file else 0,
+            created_at=datetime.fromtimestamp(st.st_ctime, tz=timezone.utc),
+            modified_at=datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
+            is_file=is_file,
+            is_directory=stat.S_ISDIR(st.st_mode),
+        )
+
+        with self._info_cache_mutex:
+            self._info_cache[path] = (signature, info)
+            self._info_cache.move_to_end(path)
+            if len(self._info_cache) > _FILE_INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+        return info
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return get_file_info() cache counters.
+
+        Counters stay at zero unless the handler was created with
+        track_cache_stats=True.
+
+        Returns:
+            Copy of the counters: "hits", "cold_misses" (path not cached) and
+            "stale_misses" (cached entry outdated by a newer mtime or ctime).
+        """
+        with self._info_cache_mutex:
+            return dict(self._info_cache_stats)
+
     # =========================================================================
     # File Locking Operations
     # =========================================================================
@@ -699,7 +1414,11 @@ class FileHandler:
     async def acquire_lock(self, path: Path, timeout: float = 10.0) -> FileLock:
         """Acquire a lock on a file.
 
-        Uses a .lock file to indicate the lock is held.
+        Uses a .lock file to indicate the lock is held. The lock file records
+        the owner as ``pid:hostname:epoch`` so a lock left behind by a crashed
+        process on this host is broken instead of waited out. Waiters are woken as soon as
+        a lock is released in this process; locks held by other processes are
+        re-checked every 50 ms.
 
         Args:
             path: Path to the file to lock.
@@ -715,42 +1434,60 @@ class FileHandler:
         """
         # Compute lock_file path (same logic as FileLock.lock_file property)
         lock_file = path.parent / f".{path.name}.lock"
-        start_time = time.monotonic()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
         while True:
-            # Try to acquire lock
-            acquired = await asyncio.to_thread(self._try_acquire_lock_sync, path, lock_file)
-
-            if acquired:
-                lock = FileLock(
-                    path=path,
-                    acquired_at=datetime.now(timezone.utc),
-                )
-                with self._locks_mutex:
-                    self._active_locks[path] = lock
-                return lock
-
-            # Check timeout
-            elapsed = time.monotonic() - start_time
-            if elapsed >= timeout:
-                raise FileLockError(
-                    message=f"Timeout acquiring lock for: {path}",
-                    details={
-                        "path": str(path),
-                        "timeout": timeout,
-                        "lock_file": str(lock_file),
-                        "lock_file_exists": lock_file.exists(),
-                    },
-                )
-
-            # Wait a bit before retrying
-            await asyncio.sleep(0.01)
+            # Register before trying so a release in between is not missed
+            waiter: "asyncio.Future[None]" = loop.create_future()
+            with _lock_waiters_mutex:
+                _lock_waiters.setdefault(lock_file, set()).add(waiter)
+            try:
+                # Try to acquire lock
+                owner = await _to_io_thread(self._try_acquire_lock_sync, path, lock_file)
+
+                if owner is not None:
+                    lock = FileLock(
+                        path=path,
+                        acquired_at=datetime.now(timezone.utc),
+                        owner=owner,
+                    )
+                    with self._locks_mutex:
+                        self._active_locks[path] = lock
+                    return lock
+
+                # Check timeout
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise FileLockError(
+                        message=f"Timeout acquiring lock for: {path}",
+                        details={
+                            "path": str(path),
+                            "timeout": timeout,
+                            "lock_file": str(lock_file),
+                            "lock_file_exists": lock_file.exists(),
+                        },
+                    )
 
-    def _try_acquire_lock_sync(self, path: Path, lock_file: Path) -> bool:
+                # Wait for an in-process release, polling for other processes
+                try:
+                    await asyncio.wait_for(waiter, timeout=min(_LOCK_POLL_INTERVAL, remaining))
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                with _lock_waiters_mutex:
+                    waiters = _lock_waiters.get(lock_file)
+                    if waiters is not None:
+                        waiters.discard(waiter)
+                        if not waiters:
+                            del _lock_waiters[lock_file]
+
+    def _try_acquire_lock_sync(self, path: Path, lock_file: Path) -> Optional[str]:
         """Try to acquire lock synchronously.
 
         Returns:
-            True if lock was acquired, False if lock is held by another process.
+            The owner record written to the lock file if the lock was acquired,
+            None if the lock is held by another owner.
 
         Raises:
             FileAccessError: If there's a permission error creating the lock file.
@@ -760,16 +1497,13 @@ class FileHandler:
             # Ensure parent directory exists
             lock_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Try to create lock file exclusively
-            fd = os.open(
-                str(lock_file),
-                os.O_CREAT | os.O_EXCL | os.O_WRONLY,
-            )
-            os.close(fd)
-            return True
-        except FileExistsError:
-            # Lock already held by another process - expected behavior
-            return False
+            owner = self._create_lock_file_sync(lock_file)
+            if owner is not None:
+                return owner
+            # Lock already held - take it over only if the owner is gone
+            if self._break_stale_lock_sync(lock_file):
+                return self._create_lock_file_sync(lock_file)
+            return None
         except PermissionError as e:
             # Permission denied - raise immediately instead of waiting for timeout
             raise FileAccessError(
@@ -784,24 +1518,121 @@ class FileHandler:
                 details={"path": str(path), "lock_file": str(lock_file), "error": str(e)},
             ) from e
 
+    def _create_lock_file_sync(self, lock_file: Path) -> Optional[str]:
+        """Exclusively create a lock file recording this process as owner.
+
+        Returns:
+            The ``pid:hostname:epoch`` record written if the lock file was
+            created, None if it already exists.
+
+        Raises:
+            OSError: If the lock file cannot be created or written.
+        """
+        try:
+            fd = os.open(str(lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return None
+        owner = f"{os.getpid()}:{_HOSTNAME}:{time.time()}".encode("ascii", "replace").decode("ascii")
+        try:
+            os.write(fd, owner.encode("ascii"))
+        except OSError:
+            os.close(fd)
+            lock_file.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+        return owner
+
+    def _break_stale_lock_sync(self, lock_file: Path) -> bool:
+        """Remove a lock file left behind by a crashed owner.
+
+        The lock file is renamed to a unique tombstone name before anything is
+        deleted. The rename is atomic, so of several waiters that judged the
+        same lock stale only one captures it; the others see it gone. If the
+        captured file is not the inode that was judged stale (another waiter
+        broke and re-created the lock in between), it is linked back into
+        place instead of being deleted. Identity is checked by inode, mtime and
+        content together, since a freed inode number is often reused at once.
+
+        Returns:
+            True if a stale lock was removed (or had already disappeared).
+        """
+        try:
+            before = lock_file.stat()
+            content = lock_file.read_text(encoding="utf-8", errors="replace")
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+        if not _is_stale_lock(content):
+            return False
+        tombstone = lock_file.with_name(f"{lock_file.name}.{uuid4().hex}.stale")
+        try:
+            os.rename(lock_file, tombstone)
+        except FileNotFoundError:
+            # Another waiter broke it first
+            return True
+        except OSError:
+            return False
+        try:
+            captured = tombstone.stat()
+            captured_content = tombstone.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            # Keep the tombstone: it may be a live lock
+            return False
+        if (captured.st_ino, captured.st_mtime_ns) == (
+            before.st_ino,
+            before.st_mtime_ns,
+        ) and captured_content == content:
+            tombstone.unlink(missing_ok=True)
+            logger.warning(f"Removed stale lock file {lock_file} (owner: {content.strip() or 'unknown'})")
+            return True
+        # Captured a live lock re-created after the check: restore it
+        try:
+            os.link(tombstone, lock_file)
+        except OSError as e:
+            # Never delete a live lock; leave it where it is for manual cleanup
+            logger.error(
+                f"Could not restore lock file {lock_file} after a concurrent break: {e}. "
+                f"The captured lock (owner: {captured_content.strip() or 'unknown'}) was left as {tombstone}"
+            )
+            return False
+        tombstone.unlink(missing_ok=True)
+        return False
+
     async def release_lock(self, lock: FileLock) -> None:
         """Release a previously acquired lock.
 
         Args:
             lock: The FileLock object to release.
         """
-        await asyncio.to_thread(self._release_lock_sync, lock)
+        await _to_io_thread(self._release_lock_sync, lock)
+        _notify_lock_released(lock.lock_file)
 
-        # Remove from active locks with thread safety
+        # Remove from active locks with thread safety, unless the path has
+        # since been locked again by a newer FileLock
         with self._locks_mutex:
-            if lock.path in self._active_locks:
+            if self._active_locks.get(lock.path) is lock:
                 del self._active_locks[lock.path]
 
     def _release_lock_sync(self, lock: FileLock) -> None:
-        """Synchronous implementation of release_lock."""
+        """Synchronous implementation of release_lock.
+
+        A lock carrying an owner record only removes the lock file if the file
+        still holds that record, so releasing never deletes another owner's lock.
+        """
         try:
-            if lock.lock_file.exists():
-                lock.lock_file.unlink()
+            if lock.owner:
+                try:
+                    content = lock.lock_file.read_text(encoding="utf-8", errors="replace")
+                except FileNotFoundError:
+                    return
+                if content != lock.owner:
+                    logger.warning(
+                        f"Not removing lock file {lock.lock_file} on release: it is now owned by "
+                        f"{content.strip() or 'unknown'}, not {lock.owner}"
+                    )
+                    return
+            lock.lock_file.unlink(missing_ok=True)
         except OSError as e:
             # Log at ERROR level with actionable guidance - orphan lock files can
             # block future operations indefinitely
@@ -27,7 +27,7 @@ Example usage::
 import logging
 from io import StringIO
 from pathlib import Path
-from typing import Type, TypeVar
+from typing import Iterable, List, Type, TypeVar
 
 from pydantic import BaseModel
 from pydantic import ValidationError as PydanticValidationError
@@ -88,6 +88,10 @@ class YAMLHandler:
         # Default ruamel.yaml width (80) causes URLs, base64 data, and long
         # text fields to wrap mid-value, breaking round-trip fidelity.
         self._yaml.width = 4096
+        # Loading goes through the safe loader: deserialize() discards comments
+        # anyway, and it uses the libyaml C parser when ruamel.yaml.clib is
+        # installed instead of building round-trip CommentedMap nodes.
+        self._loader = YAML(typ="safe")
 
     def serialize(self, model: BaseModel) -> str:
         """Serialize a Pydantic model to a YAML string.
@@ -106,11 +110,38 @@ class YAMLHandler:
             YAMLParseError: If serialization fails due to non-serializable data
                 or YAML encoding issues.
         """
+        stream = StringIO()
+        self._dump(model, stream)
+        return stream.getvalue()
+
+    def serialize_many(self, models: Iterable[BaseModel]) -> List[str]:
+        """Serialize several Pydantic models to separate YAML strings.
+
+        Equivalent to calling serialize() for each model, but reuses one
+        output buffer across the batch.
+
+        Args:
+            models: The Pydantic model instances to serialize.
+
+        Returns:
+            One YAML string per model, in input order.
+
+        Raises:
+            YAMLParseError: If any model fails to serialize.
+        """
+        stream = StringIO()
+        results: List[str] = []
+        for model in models:
+            stream.seek(0)
+            stream.truncate()
+            self._dump(model, stream)
+            results.append(stream.getvalue())
+        return results
+
+    def _dump(self, model: BaseModel, stream: StringIO) -> None:
+        """Dump a model into stream, mapping failures to YAMLParseError."""
         try:
-            data = model.model_dump(mode="json")
-            stream = StringIO()
-            self._yaml.dump(data, stream)
-            return stream.getvalue()
+            self._yaml.dump(model.model_dump(mode="json"), stream)
         except PydanticSerializationError as e:
             raise YAMLParseError(
                 message=(f"Failed to serialize {type(model).__name__}: " "model contains non-serializable data"),
@@ -125,15 +156,19 @@ class YAMLHandler:
                 details={"model_type": type(model).__name__, "error": str(e)},
             ) from e
 
-    def deserialize(self, yaml_str: str, model_class: Type[T]) -> T:
+    def deserialize(self, yaml_str: str, model_class: Type[T], trusted: bool = False) -> T:
         """Deserialize a YAML string to a Pydantic model instance.
 
-        Parses the YAML string and validates it against the specified Pydantic
-        model class using model_validate().
+        Parses the YAML string with the safe loader (C-accelerated when
+        available) and validates it against the specified Pydantic model
+        class using model_validate().
 
         Args:
             yaml_str: The YAML string to deserialize.
             model_class: The Pydantic model class to validate against.
+            trusted: If True, the content was written by this application and
+                models may skip redundant nested validation (passed to
+                model_validate as ``context={"trusted": True}``).
 
         Returns:
             An instance of model_class populated with data from the YAML.
@@ -143,14 +178,14 @@ class YAMLHandler:
                 fails Pydantic validation.
         """
         try:
-            data = self._yaml.load(StringIO(yaml_str))
+            data = self._loader.load(yaml_str)
             if data is None:
                 logger.debug(
                     "YAML parsed to None (empty or null content), " "using empty dict for %s validation",
                     model_class.__name__,
                 )
                 data = {}
-            return model_class.model_validate(data)
+            return model_class.model_validate(data, context={"trusted": True} if trusted else None)
         except YAMLError as e:
             raise YAMLParseError(
                 message=f"Invalid YAML syntax: {e}",
@@ -165,6 +200,22 @@ class YAMLHandler:
                 },
             ) from e
 
+    def deserialize_many(self, yaml_strs: Iterable[str], model_class: Type[T], trusted: bool = False) -> List[T]:
+        """Deserialize several YAML strings to instances of one model class.
+
+        Args:
+            yaml_strs: The YAML strings to deserialize.
+            model_class: The Pydantic model class to validate against.
+            trusted: Passed through to deserialize() for every string.
+
+        Returns:
+            One model instance per YAML string, in input order.
+
+        Raises:
+            YAMLParseError: If any string is invalid YAML or fails validation.
+        """
+        return [self.deserialize(yaml_str, model_class, trusted=trusted) for yaml_str in yaml_strs]
+
     async def save(self, model: BaseModel, path: Path) -> None:
         """Save a Pydantic model to a YAML file.
 
@@ -187,7 +238,7 @@ class YAMLHandler:
         yaml_str = self.serialize(model)
         await self._file_handler.write_file(path, yaml_str)
 
-    async def load(self, path: Path, model_class: Type[T]) -> T:
+    async def load(self, path: Path, model_class: Type[T], trusted: bool = False) -> T:
         """Load a YAML file into a Pydantic model instance.
 
         Reads the file content and deserializes it to the specified model class.
@@ -199,6 +250,8 @@ class YAMLHandler:
         Args:
             path: The file path to read from.
             model_class: The Pydantic model class to validate against.
+            trusted: If True, skip redundant nested validation for files
+                written by this application (see deserialize()).
 
         Returns:
             An instance of model_class populated with data from the file.
@@ -210,4 +263,4 @@ class YAMLHandler:
             FileOperationError: For other file operation errors.
         """
         yaml_str = await self._file_handler.read_file(path)
-        return self.deserialize(yaml_str, model_class)
+        return self.deserialize(yaml_str, model_class, trusted=trusted)
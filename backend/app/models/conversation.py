@@ -5,16 +5,81 @@ conversation thread with a recruiter.
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
 from app.models.analysis import ContextAnalysis, JobFitScore
 from app.models.enums import Platform, ProcessStatus
 from app.models.message import Message
 from app.models.metrics import ResponseMetrics
-from app.models.validators import validate_path_in_data_dir
+from app.models.validators import validate_attachment_paths, validate_path_in_data_dir
+
+
+def _construct_message(item: Dict[str, Any]) -> Optional[Message]:
+    """Build a Message from a trusted raw dict, skipping full validation.
+
+    Field types are checked cheaply and attachment paths are still confined
+    to the data directory. Anything unexpected returns None so the caller
+    can leave the item to regular validation (and its error reporting).
+
+    Args:
+        item: Raw message dict.
+
+    Returns:
+        An unvalidated Message instance, or None if the dict does not have
+        the expected shape.
+    """
+    timestamp = item.get("timestamp")
+    from_name = item.get("from_name")
+    body = item.get("body")
+    to_name = item.get("to_name")
+    subject = item.get("subject")
+    attachments = item.get("attachments", ())
+    if not isinstance(from_name, str) or not isinstance(body, str):
+        return None
+    if not isinstance(to_name, (str, type(None))) or not isinstance(subject, (str, type(None))):
+        return None
+    if not isinstance(attachments, (list, tuple)) or not all(isinstance(a, str) for a in attachments):
+        return None
+    try:
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        elif not isinstance(timestamp, datetime):
+            return None
+        attachments = validate_attachment_paths(tuple(attachments))
+    except ValueError:
+        return None
+    return Message.model_construct(
+        timestamp=timestamp,
+        from_name=from_name,
+        to_name=to_name,
+        subject=subject,
+        body=body,
+        attachments=attachments,
+    )
+
+
+def _decode_messages(raw: List[Any]) -> List[Any]:
+    """Build Message instances from trusted raw dicts without full validation.
+
+    Used for data we wrote ourselves (e.g. YAML files in the data directory),
+    where per-message validation is redundant. Items that are not dicts, or
+    dicts that do not have the expected shape, are passed through unchanged
+    for regular validation.
+
+    Args:
+        raw: List of raw message dicts (or Message instances).
+
+    Returns:
+        List with each well-formed dict replaced by a Message instance.
+    """
+    messages: List[Any] = []
+    for item in raw:
+        message = _construct_message(item) if isinstance(item, dict) else None
+        messages.append(item if message is None else message)
+    return messages
 
 
 class Conversation(BaseModel):
@@ -42,6 +107,11 @@ class Conversation(BaseModel):
         archive_reason: Reason for archiving.
         related_conversation_ids: IDs of related conversations.
 
+    Trusted Input:
+        When validated with ``context={"trusted": True}`` (e.g. when loading
+        our own YAML files), messages are built via Message.model_construct
+        and skip per-message validation.
+
     Archive Behavior:
         When archived=True: archived_at is auto-populated with current UTC timestamp
             if not explicitly provided. archive_reason is optional.
@@ -73,6 +143,18 @@ class Conversation(BaseModel):
     archive_reason: Optional[str] = None
     related_conversation_ids: List[str] = Field(default_factory=list)
 
+    @model_validator(mode="before")
+    @classmethod
+    def construct_trusted_messages(cls, data: Any, info: ValidationInfo) -> Any:
+        """Skip per-message validation for trusted input.
+
+        Only applies when the validation context sets ``trusted``; API input
+        is always fully validated.
+        """
+        if info.context and info.context.get("trusted") and isinstance(data, dict) and data.get("messages"):
+            data = {**data, "messages": _decode_messages(data["messages"])}
+        return data
+
     @field_validator("job_description_filepath", "resume_filepath")
     @classmethod
     def validate_filepath(cls, v: Optional[str]) -> Optional[str]:
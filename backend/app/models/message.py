@@ -5,9 +5,9 @@ in a conversation thread.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from app.models.validators import validate_attachment_paths
 
@@ -15,24 +15,29 @@ from app.models.validators import validate_attachment_paths
 class Message(BaseModel):
     """A single message in a conversation thread.
 
+    This is an immutable value object, hashable so messages can be used in
+    sets and as dictionary keys (e.g. for de-duplication).
+
     Attributes:
         timestamp: When the message was sent.
         from_name: Name of the message sender.
         to_name: Name of the recipient (optional).
         subject: Message subject line (optional, mainly for emails).
         body: The message content.
-        attachments: List of attachment file paths.
+        attachments: Tuple of attachment file paths.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime
     from_name: str
     to_name: Optional[str] = None
     subject: Optional[str] = None
     body: str
-    attachments: List[str] = Field(default_factory=list)
+    attachments: Tuple[str, ...] = ()
 
     @field_validator("attachments")
     @classmethod
-    def validate_attachments(cls, v: List[str]) -> List[str]:
+    def validate_attachments(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
         """Validate that all attachment paths are within the data directory."""
         return validate_attachment_paths(v)
@@ -17,6 +17,9 @@ class Participant(BaseModel):
     This is an immutable value object representing a participant's identity.
     Once created, it cannot be modified - use a new instance for updates.
 
+    Schema building is deferred until first use so that importing this
+    module does not pull in email-validator at startup.
+
     Attributes:
         name: Full name of the participant.
         role: The participant's role in the conversation.
@@ -24,7 +27,7 @@ class Participant(BaseModel):
         company: Company or organization (optional).
     """
 
-    model_config = ConfigDict(use_enum_values=True, frozen=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True, defer_build=True)
 
     name: str
     role: ParticipantRole
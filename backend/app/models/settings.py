@@ -6,7 +6,7 @@ preferences and configuration.
 
 from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from app.models.validators import validate_path_in_data_dir
 
@@ -14,6 +14,9 @@ from app.models.validators import validate_path_in_data_dir
 class UserSettings(BaseModel):
     """User settings and preferences.
 
+    Schema building is deferred until first use so that importing this
+    module does not pull in email-validator at startup.
+
     Attributes:
         user_name: The user's display name.
         user_email: The user's email address.
@@ -22,6 +25,8 @@ class UserSettings(BaseModel):
         preferences: Additional user preferences as key-value pairs.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     user_name: str
     user_email: EmailStr
     default_model: Literal["sonnet", "haiku", "opus"]
@@ -5,12 +5,23 @@ including security-focused path validation.
 """
 
 import os
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from app.config import get_settings
 
 
+@lru_cache(maxsize=1)
+def _data_dir() -> Path:
+    """Return the resolved data directory, cached for the process lifetime.
+
+    Call ``_data_dir.cache_clear()`` after changing settings (e.g. in tests).
+    """
+    return Path(get_settings().data_dir).resolve()
+
+
 def validate_path_in_data_dir(path: Optional[str]) -> Optional[str]:
     """Validate that a path resolves to within the data directory.
 
@@ -30,8 +41,7 @@ def validate_path_in_data_dir(path: Optional[str]) -> Optional[str]:
     if path is None:
         return path
 
-    settings = get_settings()
-    data_dir = Path(settings.data_dir).resolve()
+    data_dir = _data_dir()
 
     # Resolve the path relative to data_dir
     if os.path.isabs(path):
@@ -48,21 +58,21 @@ def validate_path_in_data_dir(path: Optional[str]) -> Optional[str]:
     return path
 
 
-def validate_attachment_paths(paths: List[str]) -> List[str]:
-    """Validate all paths in an attachments list.
+def validate_attachment_paths(paths: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Validate all paths in an attachments tuple.
 
-    Ensures that all file paths in the list resolve to within
+    Ensures that all file paths in the tuple resolve to within
     the configured data directory.
 
     Args:
-        paths: List of file paths to validate.
+        paths: Tuple of file paths to validate.
 
     Returns:
-        The validated list of paths (unchanged if valid).
+        The validated tuple of paths (unchanged if valid).
 
     Raises:
         ValueError: If any path resolves outside the allowed data directory.
     """
-    for path in paths:
-        validate_path_in_data_dir(path)
+    # Consume the map in C; validation raises on the first bad path
+    deque(map(validate_path_in_data_dir, paths), maxlen=0)
     return paths
@@ -1,7 +1,8 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, Dict, Generator
 from uuid import UUID
 
 import pytest
@@ -9,6 +10,34 @@ from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
+from app.models.analysis import ContextAnalysis, JobFitScore
+from app.models.conversation import Conversation
+from app.models.message import Message
+from app.models.metrics import ResponseMetrics
+from app.models.settings import UserSettings
+from app.models.validators import _data_dir
+
+_FIXED_DATETIME = datetime(2025, 12, 9, 10, 0, 0, tzinfo=timezone.utc)
+_FIXED_UUID_STR = "550e8400-e29b-41d4-a716-446655440000"
+
+# ============================================
+# EVENT LOOP FIXTURES
+# ============================================
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when available, matching the uvicorn server loop.
+
+    uvloop is installed through ``uvicorn[standard]`` on platforms that support
+    it; elsewhere (e.g. Windows) the default asyncio policy is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
 
 # ============================================
 # API CLIENT FIXTURES
@@ -29,6 +58,14 @@ async def async_client() -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
 
+@pytest.fixture(autouse=True)
+def _clear_data_dir_cache() -> Generator[None, None, None]:
+    """Reset the cached data directory so patched settings take effect per test."""
+    _data_dir.cache_clear()
+    yield
+    _data_dir.cache_clear()
+
+
 @pytest.fixture
 def test_settings() -> Dict[str, Any]:
     """Provide test settings override."""
@@ -49,7 +86,7 @@ def fixed_datetime() -> datetime:
     Returns:
         A timezone-aware datetime set to 2025-12-09T10:00:00Z.
     """
-    return datetime(2025, 12, 9, 10, 0, 0, tzinfo=timezone.utc)
+    return _FIXED_DATETIME
 
 
 @pytest.fixture
@@ -84,7 +121,7 @@ def fixed_uuid_str() -> str:
     Returns:
         A fixed UUID string value.
     """
-    return "550e8400-e29b-41d4-a716-446655440000"
+    return _FIXED_UUID_STR
 
 
 # ============================================
@@ -92,6 +129,18 @@ def fixed_uuid_str() -> str:
 # ============================================
 
 
+def _message_data(timestamp: datetime) -> Dict[str, Any]:
+    """Build a fresh copy of the sample_message_data payload."""
+    return {
+        "timestamp": timestamp,
+        "from_name": "John Recruiter",
+        "to_name": "Candidate Name",
+        "subject": "Senior Engineer Position at Company A",
+        "body": "Hi! I came across your profile and think you'd be a great fit.",
+        "attachments": ["job_description.pdf"],
+    }
+
+
 @pytest.fixture
 def sample_message_data(fixed_datetime: datetime) -> Dict[str, Any]:
     """Provide sample message data for testing.
@@ -102,14 +151,7 @@ def sample_message_data(fixed_datetime: datetime) -> Dict[str, Any]:
     Returns:
         Dictionary containing valid message data.
     """
-    return {
-        "timestamp": fixed_datetime,
-        "from_name": "John Recruiter",
-        "to_name": "Candidate Name",
-        "subject": "Senior Engineer Position at Company A",
-        "body": "Hi! I came across your profile and think you'd be a great fit.",
-        "attachments": ["job_description.pdf"],
-    }
+    return _message_data(fixed_datetime)
 
 
 @pytest.fixture
@@ -167,13 +209,8 @@ def sample_participant_minimal_data() -> Dict[str, Any]:
 # ============================================
 
 
-@pytest.fixture
-def sample_sentiment_trend_data() -> Dict[str, Any]:
-    """Provide sample sentiment trend data.
-
-    Returns:
-        Dictionary containing valid sentiment trend data.
-    """
+def _sentiment_trend_data() -> Dict[str, Any]:
+    """Build a fresh copy of the sample_sentiment_trend_data payload."""
     return {
         "initial": "positive",
         "current": "positive",
@@ -186,12 +223,17 @@ def sample_sentiment_trend_data() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def sample_conversation_stage_data() -> Dict[str, Any]:
-    """Provide sample conversation stage data.
+def sample_sentiment_trend_data() -> Dict[str, Any]:
+    """Provide sample sentiment trend data.
 
     Returns:
-        Dictionary containing valid conversation stage data.
+        Dictionary containing valid sentiment trend data.
     """
+    return _sentiment_trend_data()
+
+
+def _conversation_stage_data() -> Dict[str, Any]:
+    """Build a fresh copy of the sample_conversation_stage_data payload."""
     return {
         "current": "initial_outreach",
         "progression_quality": "smooth",
@@ -199,12 +241,17 @@ def sample_conversation_stage_data() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def sample_action_items_data() -> Dict[str, Any]:
-    """Provide sample action items data.
+def sample_conversation_stage_data() -> Dict[str, Any]:
+    """Provide sample conversation stage data.
 
     Returns:
-        Dictionary containing valid action items data.
+        Dictionary containing valid conversation stage data.
     """
+    return _conversation_stage_data()
+
+
+def _action_items_data() -> Dict[str, Any]:
+    """Build a fresh copy of the sample_action_items_data payload."""
     return {
         "candidate_pending": [
             "Wait for recruiter's response with more details",
@@ -215,6 +262,34 @@ def sample_action_items_data() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def sample_action_items_data() -> Dict[str, Any]:
+    """Provide sample action items data.
+
+    Returns:
+        Dictionary containing valid action items data.
+    """
+    return _action_items_data()
+
+
+def _context_analysis_data(
+    timestamp: datetime,
+    sentiment_trend: Dict[str, Any],
+    conversation_stage: Dict[str, Any],
+    action_items: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build a fresh copy of the sample_context_analysis_data payload."""
+    return {
+        "summary": "Initial recruiter outreach for senior engineering role.",
+        "sentiment_trend": sentiment_trend,
+        "conversation_stage": conversation_stage,
+        "action_items": action_items,
+        "patterns_detected": ["Recruiter mentioned specific skills from profile"],
+        "recommendations": ["Ask about H1B sponsorship in next message"],
+        "last_analyzed": timestamp,
+    }
+
+
 @pytest.fixture
 def sample_context_analysis_data(
     fixed_datetime: datetime,
@@ -233,15 +308,9 @@ def sample_context_analysis_data(
     Returns:
         Dictionary containing valid context analysis data.
     """
-    return {
-        "summary": "Initial recruiter outreach for senior engineering role.",
-        "sentiment_trend": sample_sentiment_trend_data,
-        "conversation_stage": sample_conversation_stage_data,
-        "action_items": sample_action_items_data,
-        "patterns_detected": ["Recruiter mentioned specific skills from profile"],
-        "recommendations": ["Ask about H1B sponsorship in next message"],
-        "last_analyzed": fixed_datetime,
-    }
+    return _context_analysis_data(
+        fixed_datetime, sample_sentiment_trend_data, sample_conversation_stage_data, sample_action_items_data
+    )
 
 
 # ============================================
@@ -249,13 +318,8 @@ def sample_context_analysis_data(
 # ============================================
 
 
-@pytest.fixture
-def sample_job_fit_score_data() -> Dict[str, Any]:
-    """Provide sample job fit score data.
-
-    Returns:
-        Dictionary containing valid job fit score data.
-    """
+def _job_fit_score_data() -> Dict[str, Any]:
+    """Build a fresh copy of the sample_job_fit_score_data payload."""
     return {
         "overall_score": 85.0,
         "required_skills_score": 90.0,
@@ -280,6 +344,16 @@ def sample_job_fit_score_data() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def sample_job_fit_score_data() -> Dict[str, Any]:
+    """Provide sample job fit score data.
+
+    Returns:
+        Dictionary containing valid job fit score data.
+    """
+    return _job_fit_score_data()
+
+
 @pytest.fixture
 def invalid_score_data() -> Dict[str, Any]:
     """Provide data with out-of-range score values.
@@ -303,6 +377,16 @@ def invalid_score_data() -> Dict[str, Any]:
 # ============================================
 
 
+def _response_metrics_data() -> Dict[str, Any]:
+    """Build a fresh copy of the sample_response_metrics_data payload."""
+    return {
+        "recruiter_avg_hours": 24.5,
+        "candidate_avg_hours": 5.5,
+        "recruiter_message_count": 3,
+        "candidate_message_count": 2,
+    }
+
+
 @pytest.fixture
 def sample_response_metrics_data() -> Dict[str, Any]:
     """Provide sample response metrics data.
@@ -310,12 +394,7 @@ def sample_response_metrics_data() -> Dict[str, Any]:
     Returns:
         Dictionary containing valid response metrics data.
     """
-    return {
-        "recruiter_avg_hours": 24.5,
-        "candidate_avg_hours": 5.5,
-        "recruiter_message_count": 3,
-        "candidate_message_count": 2,
-    }
+    return _response_metrics_data()
 
 
 @pytest.fixture
@@ -338,33 +417,19 @@ def sample_response_metrics_partial_data() -> Dict[str, Any]:
 # ============================================
 
 
-@pytest.fixture
-def sample_conversation_data(
-    fixed_uuid_str: str,
-    fixed_datetime: datetime,
-    sample_message_data: Dict[str, Any],
-) -> Dict[str, Any]:
-    """Provide sample conversation data.
-
-    Args:
-        fixed_uuid_str: The fixed UUID string fixture.
-        fixed_datetime: The fixed datetime fixture.
-        sample_message_data: Sample message data fixture.
-
-    Returns:
-        Dictionary containing valid conversation data.
-    """
+def _conversation_data(conversation_id: str, timestamp: datetime, message: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a fresh copy of the sample_conversation_data payload."""
     return {
-        "id": fixed_uuid_str,
-        "created_at": fixed_datetime,
-        "updated_at": fixed_datetime,
+        "id": conversation_id,
+        "created_at": timestamp,
+        "updated_at": timestamp,
         "platform": "linkedin",
         "company": "Company A",
         "recruiting_company": None,
         "recruiter_name": "John Recruiter",
         "process_status": "new",
         "context": ["$150,000 yearly is in the lower range"],
-        "messages": [sample_message_data],
+        "messages": [message],
         "context_analysis": None,
         "fit_score": None,
         "response_metrics": None,
@@ -378,6 +443,25 @@ def sample_conversation_data(
     }
 
 
+@pytest.fixture
+def sample_conversation_data(
+    fixed_uuid_str: str,
+    fixed_datetime: datetime,
+    sample_message_data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Provide sample conversation data.
+
+    Args:
+        fixed_uuid_str: The fixed UUID string fixture.
+        fixed_datetime: The fixed datetime fixture.
+        sample_message_data: Sample message data fixture.
+
+    Returns:
+        Dictionary containing valid conversation data.
+    """
+    return _conversation_data(fixed_uuid_str, fixed_datetime, sample_message_data)
+
+
 @pytest.fixture
 def sample_conversation_minimal_data() -> Dict[str, Any]:
     """Provide minimal valid conversation data.
@@ -409,13 +493,8 @@ def invalid_platform_data() -> Dict[str, Any]:
 # ============================================
 
 
-@pytest.fixture
-def sample_user_settings_data() -> Dict[str, Any]:
-    """Provide sample user settings data.
-
-    Returns:
-        Dictionary containing valid user settings data.
-    """
+def _user_settings_data() -> Dict[str, Any]:
+    """Build a fresh copy of the sample_user_settings_data payload."""
     return {
         "user_name": "John Doe",
         "user_email": "john.doe@example.com",
@@ -428,19 +507,69 @@ def sample_user_settings_data() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def sample_user_settings_data() -> Dict[str, Any]:
+    """Provide sample user settings data.
+
+    Returns:
+        Dictionary containing valid user settings data.
+    """
+    return _user_settings_data()
+
+
 # ============================================
-# YAML SERIALIZATION FIXTURES
+# SESSION-SCOPED MODEL FIXTURES
 # ============================================
+# Validated once per run from the same payloads as the sample_*_data
+# fixtures. Instances are shared across tests, so tests must not mutate them.
 
 
-@pytest.fixture
-def sample_yaml_conversation() -> str:
-    """Provide sample YAML conversation content.
+@pytest.fixture(scope="session")
+def sample_message() -> Message:
+    """Provide a validated Message built from sample_message_data."""
+    return Message(**_message_data(_FIXED_DATETIME))
 
-    Returns:
-        String containing valid YAML conversation data.
-    """
-    return """
+
+@pytest.fixture(scope="session")
+def sample_conversation() -> Conversation:
+    """Provide a validated Conversation built from sample_conversation_data."""
+    return Conversation(**_conversation_data(_FIXED_UUID_STR, _FIXED_DATETIME, _message_data(_FIXED_DATETIME)))
+
+
+@pytest.fixture(scope="session")
+def sample_context_analysis() -> ContextAnalysis:
+    """Provide a validated ContextAnalysis built from sample_context_analysis_data."""
+    return ContextAnalysis(
+        **_context_analysis_data(
+            _FIXED_DATETIME, _sentiment_trend_data(), _conversation_stage_data(), _action_items_data()
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_job_fit_score() -> JobFitScore:
+    """Provide a validated JobFitScore built from sample_job_fit_score_data."""
+    return JobFitScore(**_job_fit_score_data())
+
+
+@pytest.fixture(scope="session")
+def sample_response_metrics() -> ResponseMetrics:
+    """Provide a validated ResponseMetrics built from sample_response_metrics_data."""
+    return ResponseMetrics(**_response_metrics_data())
+
+
+@pytest.fixture(scope="session")
+def sample_user_settings() -> UserSettings:
+    """Provide a validated UserSettings built from sample_user_settings_data."""
+    return UserSettings(**_user_settings_data())
+
+
+# ============================================
+# YAML SERIALIZATION FIXTURES
+# ============================================
+
+
+_SAMPLE_YAML_CONVERSATION = """
 id: "550e8400-e29b-41d4-a716-446655440000"
 created_at: 2025-12-09T10:00:00+00:00
 updated_at: 2025-12-09T15:30:00+00:00
@@ -465,3 +594,23 @@ messages:
 archived: false
 related_conversation_ids: []
 """
+
+
+@pytest.fixture(scope="session")
+def sample_yaml_conversation() -> str:
+    """Provide sample YAML conversation content.
+
+    Returns:
+        String containing valid YAML conversation data.
+    """
+    return _SAMPLE_YAML_CONVERSATION
+
+
+@pytest.fixture(scope="session")
+def sample_yaml_conversation_bytes() -> bytes:
+    """Provide the sample YAML conversation pre-encoded as UTF-8.
+
+    Returns:
+        Bytes for loaders that read raw input without a str round-trip.
+    """
+    return _SAMPLE_YAML_CONVERSATION.encode("utf-8")
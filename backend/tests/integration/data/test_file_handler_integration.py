@@ -9,8 +9,14 @@ with real filesystem interactions, including:
 """
 
 import asyncio
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+from unittest.mock import Mock
 
 import pytest
 
@@ -28,14 +34,23 @@ def file_handler() -> FileHandler:
     return FileHandler()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_content() -> str:
-    """Provide large content for testing large file operations."""
+    """Provide large content for testing large file operations.
+
+    Session-scoped: the string is immutable, so it is built once per run.
+    """
     # Generate ~1MB of content
     line = "This is a test line with some content for large file testing.\n"
     return line * 20000  # Approximately 1.2MB
 
 
+@pytest.fixture(scope="session")
+def large_binary_content() -> bytes:
+    """Provide ~500KB of binary data covering every byte value (built once per run)."""
+    return bytes(range(256)) * 2000
+
+
 # =============================================================================
 # Full Lifecycle Tests
 # =============================================================================
@@ -141,8 +156,8 @@ class TestFileHandlerConcurrentAccess:
             async with file_handler.locked(test_file):
                 # Read current content
                 current = await file_handler.read_file(test_file)
-                # Simulate some processing
-                await asyncio.sleep(0.05)
+                # Yield so the other writers contend for the lock mid-update
+                await asyncio.sleep(0)
                 # Write new content
                 await file_handler.write_file(test_file, f"{current},{value}")
                 results.append(value)
@@ -245,19 +260,19 @@ class TestFileHandlerLargeFiles:
         assert info.size > 0
         assert info.is_file is True
 
-    async def test_large_binary_file(self, tmp_path: Path, file_handler: FileHandler) -> None:
+    async def test_large_binary_file(
+        self, tmp_path: Path, file_handler: FileHandler, large_binary_content: bytes
+    ) -> None:
         """Test writing and reading large binary files."""
         # Arrange
         large_binary = tmp_path / "large_binary.bin"
-        # Generate ~500KB of binary data
-        binary_content = bytes(range(256)) * 2000
 
         # Act
-        await file_handler.write_bytes(large_binary, binary_content)
+        await file_handler.write_bytes(large_binary, large_binary_content)
         read_content = await file_handler.read_bytes(large_binary)
 
         # Assert
-        assert read_content == binary_content
+        assert read_content == large_binary_content
 
 
 # =============================================================================
@@ -273,23 +288,22 @@ class TestFileHandlerPatternMatching:
         """Test listing directory with various glob patterns."""
         # Arrange - Create files with different extensions
         extensions = ["txt", "yaml", "json", "md", "py"]
-        for ext in extensions:
-            for i in range(3):
-                file_path = tmp_path / f"file_{i}.{ext}"
-                await file_handler.write_file(file_path, f"content for {ext}")
-
-        # Act & Assert - Test different patterns
-        txt_files = await file_handler.list_directory(tmp_path, pattern="*.txt")
-        assert len(txt_files) == 3
-
-        yaml_files = await file_handler.list_directory(tmp_path, pattern="*.yaml")
-        assert len(yaml_files) == 3
+        await asyncio.gather(
+            *(
+                file_handler.write_file(tmp_path / f"file_{i}.{ext}", f"content for {ext}")
+                for ext in extensions
+                for i in range(3)
+            )
+        )
 
-        all_files = await file_handler.list_directory(tmp_path, pattern="*")
-        assert len(all_files) == 15
+        # Act - Group a single directory scan by each pattern
+        grouped = await file_handler.list_directory_grouped(tmp_path, ["*.txt", "*.yaml", "*", "file_0.*"])
 
-        file_0_files = await file_handler.list_directory(tmp_path, pattern="file_0.*")
-        assert len(file_0_files) == 5
+        # Assert
+        assert len(grouped["*.txt"]) == 3
+        assert len(grouped["*.yaml"]) == 3
+        assert len(grouped["*"]) == 15
+        assert len(grouped["file_0.*"]) == 5
 
     async def test_recursive_directory_listing(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test that list_directory only lists immediate children."""
@@ -378,12 +392,14 @@ class TestFileHandlerEdgeCases:
         test_dir = tmp_path / "sequential"
         await file_handler.create_directory(test_dir)
 
-        # Act - Perform many operations
+        # Act - Perform many operations, one open/close pair per file
         for i in range(50):
             file_path = test_dir / f"file_{i}.txt"
-            content = f"Content for file {i}"
-            await file_handler.write_file(file_path, content)
-            read_content = await file_handler.read_file(file_path)
+            content = f"Content for file {i}".encode("utf-8")
+            async with file_handler.opened(file_path, "w+b") as f:
+                await f.write(content)
+                await f.seek(0)
+                read_content = await f.read()
             assert read_content == content
 
         # Assert - All files exist
@@ -393,6 +409,20 @@ class TestFileHandlerEdgeCases:
         # Cleanup
         await file_handler.delete_directory(test_dir, recursive=True)
 
+    async def test_batched_write_and_read_operations(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test many file operations issued as concurrent batches."""
+        # Arrange
+        test_dir = tmp_path / "batched"
+        items = [(test_dir / f"file_{i}.txt", f"Content for file {i}") for i in range(50)]
+
+        # Act
+        await file_handler.write_many(items)
+        contents = await asyncio.gather(*(file_handler.read_file(path) for path, _ in items))
+
+        # Assert
+        assert contents == [content for _, content in items]
+        assert len(await file_handler.list_directory(test_dir)) == 50
+
 
 # =============================================================================
 # Cross-Instance Locking Tests
@@ -429,15 +459,13 @@ class TestFileHandlerCrossInstanceLocking:
         assert isinstance(lock2, FileLock)
         await handler2.release_lock(lock2)
 
-    async def test_orphaned_lock_file_handling(self, tmp_path: Path) -> None:
-        """Test behavior when encountering orphaned lock files.
+    async def test_orphaned_lock_file_handling(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test behavior when encountering a recent lock file without owner info.
 
-        This test verifies that the current implementation correctly times out
-        when an orphaned lock file exists. Stale lock detection (via PID tracking
-        or timestamps) is not yet implemented.
+        Without a ``pid:hostname:epoch`` record the owner cannot be checked,
+        so the lock is never broken and acquiring it must time out.
         """
         # Arrange
-        file_handler = FileHandler()
         test_file = tmp_path / "orphaned.txt"
         test_file.write_text("content", encoding="utf-8")
 
@@ -445,8 +473,7 @@ class TestFileHandlerCrossInstanceLocking:
         lock_file = tmp_path / ".orphaned.txt.lock"
         lock_file.write_text("orphaned", encoding="utf-8")
 
-        # Act & Assert - Should timeout since lock file exists
-        # (until stale detection is implemented)
+        # Act & Assert - Should timeout since lock file is recent
         with pytest.raises(FileLockError) as exc_info:
             await file_handler.acquire_lock(test_file, timeout=0.1)
 
@@ -455,3 +482,160 @@ class TestFileHandlerCrossInstanceLocking:
 
         # Cleanup - Remove orphaned lock file
         lock_file.unlink()
+
+    @pytest.mark.skipif(os.name == "nt", reason="PID liveness is not probed on Windows")
+    async def test_lock_from_dead_process_is_broken(
+        self, tmp_path: Path, file_handler: FileHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a lock owned by a dead local process is taken over immediately."""
+        # Arrange
+        monkeypatch.setattr("app.data.file_handler._pid_alive", lambda pid: False)
+        test_file = tmp_path / "crashed.txt"
+        lock_file = tmp_path / ".crashed.txt.lock"
+        lock_file.write_text(f"999999:{socket.gethostname()}:{time.time()}", encoding="utf-8")
+
+        # Act
+        lock = await file_handler.acquire_lock(test_file, timeout=0.1)
+
+        # Assert
+        assert lock_file.read_text(encoding="utf-8").startswith(f"{os.getpid()}:")
+
+        # Cleanup
+        await file_handler.release_lock(lock)
+
+    @pytest.mark.skipif(os.name == "nt", reason="PID liveness is not probed on Windows")
+    async def test_lock_from_live_process_is_kept(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that a lock owned by a running local process is not broken."""
+        # Arrange - this test process is alive, so its record is never stale
+        test_file = tmp_path / "alive.txt"
+        lock_file = tmp_path / ".alive.txt.lock"
+        lock_file.write_text(f"{os.getpid()}:{socket.gethostname()}:0", encoding="utf-8")
+        os.utime(lock_file, (0, 0))
+
+        # Act & Assert
+        with pytest.raises(FileLockError):
+            await file_handler.acquire_lock(test_file, timeout=0.1)
+
+        # Cleanup
+        lock_file.unlink()
+
+    @pytest.mark.parametrize("record", ["orphaned", "12345:another-host:0"])
+    async def test_old_lock_with_unverifiable_owner_is_kept(
+        self, tmp_path: Path, file_handler: FileHandler, record: str
+    ) -> None:
+        """Test that an old lock whose owner cannot be probed is never broken."""
+        # Arrange - the owner may be a live process on another host sharing the volume
+        test_file = tmp_path / "ancient.txt"
+        lock_file = tmp_path / ".ancient.txt.lock"
+        lock_file.write_text(record, encoding="utf-8")
+        os.utime(lock_file, (0, 0))
+
+        # Act & Assert
+        with pytest.raises(FileLockError):
+            await file_handler.acquire_lock(test_file, timeout=0.1)
+        assert lock_file.read_text(encoding="utf-8") == record
+
+    async def test_release_keeps_lock_file_owned_by_another_holder(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test that releasing a lock whose file was taken over does not delete the new owner's lock."""
+        # Arrange
+        test_file = tmp_path / "taken_over.txt"
+        lock = await file_handler.acquire_lock(test_file, timeout=0.1)
+        lock.lock_file.write_text(f"12345:{socket.gethostname()}:0", encoding="utf-8")
+
+        # Act
+        await file_handler.release_lock(lock)
+
+        # Assert
+        assert lock.lock_file.read_text(encoding="utf-8") == f"12345:{socket.gethostname()}:0"
+
+    async def test_concurrent_breakers_yield_single_owner(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that waiters breaking the same stale lock at once end up with one owner."""
+        # Arrange - every waiter judges the original lock stale before any of them acts
+        breakers = 4
+        barrier = threading.Barrier(breakers)
+        stale_content = "crashed-owner"
+
+        def judge_after_all_checked(content: str) -> bool:
+            if content == stale_content:
+                barrier.wait(timeout=5)
+                return True
+            return False
+
+        monkeypatch.setattr("app.data.file_handler._is_stale_lock", judge_after_all_checked)
+        test_file = tmp_path / "contended.txt"
+        lock_file = tmp_path / ".contended.txt.lock"
+        lock_file.write_text(stale_content, encoding="utf-8")
+        handlers = [FileHandler() for _ in range(breakers)]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=breakers) as pool:
+            results = list(pool.map(lambda h: h._try_acquire_lock_sync(test_file, lock_file), handlers))
+
+        # Assert
+        assert sum(owner is not None for owner in results) == 1
+        assert lock_file.read_text(encoding="utf-8").startswith(f"{os.getpid()}:")
+        assert not list(tmp_path.glob("*.stale"))
+
+    async def test_late_breaker_does_not_remove_recreated_lock(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a waiter acting on an outdated stale verdict leaves the new owner's lock in place."""
+        # Arrange - the first verdict lets another waiter break and re-create the lock before it is acted on
+        test_file = tmp_path / "raced.txt"
+        lock_file = tmp_path / ".raced.txt.lock"
+        lock_file.write_text("crashed-owner", encoding="utf-8")
+        first, late = FileHandler(), FileHandler()
+        first_acquired: List[Optional[str]] = []
+        raced = threading.Event()
+
+        def judge(content: str) -> bool:
+            if content == "crashed-owner" and not raced.is_set():
+                raced.set()
+                first_acquired.append(first._try_acquire_lock_sync(test_file, lock_file))
+            return content == "crashed-owner"
+
+        monkeypatch.setattr("app.data.file_handler._is_stale_lock", judge)
+
+        # Act
+        late_acquired = late._try_acquire_lock_sync(test_file, lock_file)
+
+        # Assert
+        assert first_acquired[0] is not None
+        assert late_acquired is None
+        assert lock_file.read_text(encoding="utf-8") == first_acquired[0]
+        assert lock_file.read_text(encoding="utf-8").startswith(f"{os.getpid()}:")
+        assert not list(tmp_path.glob("*.stale"))
+
+    async def test_unrestorable_captured_lock_is_not_deleted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a live lock captured by a late breaker is kept if it cannot be put back."""
+        # Arrange - another waiter re-creates the lock after the stale verdict, and linking it back fails
+        test_file = tmp_path / "unrestorable.txt"
+        lock_file = tmp_path / ".unrestorable.txt.lock"
+        lock_file.write_text("crashed-owner", encoding="utf-8")
+        first, late = FileHandler(), FileHandler()
+        first_acquired: List[Optional[str]] = []
+        raced = threading.Event()
+
+        def judge(content: str) -> bool:
+            if content == "crashed-owner" and not raced.is_set():
+                raced.set()
+                first_acquired.append(first._try_acquire_lock_sync(test_file, lock_file))
+            return content == "crashed-owner"
+
+        monkeypatch.setattr("app.data.file_handler._is_stale_lock", judge)
+        monkeypatch.setattr("app.data.file_handler.os.link", Mock(side_effect=OSError("link failed")))
+
+        # Act
+        late_acquired = late._try_acquire_lock_sync(test_file, lock_file)
+
+        # Assert
+        assert late_acquired is None
+        tombstones = list(tmp_path.glob("*.stale"))
+        assert len(tombstones) == 1
+        assert tombstones[0].read_text(encoding="utf-8") == first_acquired[0]
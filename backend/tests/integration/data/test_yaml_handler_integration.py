@@ -7,7 +7,7 @@ in the application.
 
 import asyncio
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import pytest
 
@@ -64,6 +64,21 @@ class TestYAMLHandlerWithRealModels:
         assert loaded.recruiter_name == original.recruiter_name
         assert len(loaded.messages) == len(original.messages)
 
+    async def test_conversation_trusted_load(
+        self,
+        tmp_path: Path,
+        yaml_handler: YAMLHandler,
+        sample_conversation_data: Dict[str, Any],
+    ) -> None:
+        """Test loading a Conversation as trusted preserves its messages."""
+        original = Conversation(**sample_conversation_data)
+        file_path = tmp_path / "conversation.yaml"
+
+        await yaml_handler.save(original, file_path)
+        loaded = await yaml_handler.load(file_path, Conversation, trusted=True)
+
+        assert loaded.messages == original.messages
+
     async def test_conversation_minimal_save_and_load(
         self,
         tmp_path: Path,
@@ -169,6 +184,27 @@ class TestYAMLHandlerWithRealModels:
         assert restored.resume_path == original.resume_path
         assert restored.preferences == original.preferences
 
+    def test_models_round_trip_batched(
+        self,
+        yaml_handler: YAMLHandler,
+        sample_message_data: Dict[str, Any],
+        sample_response_metrics_data: Dict[str, Any],
+        sample_user_settings_data: Dict[str, Any],
+    ) -> None:
+        """Test batched serialize_many with a mix of real models."""
+        originals = [
+            Message(**sample_message_data),
+            ResponseMetrics(**sample_response_metrics_data),
+            UserSettings(**sample_user_settings_data),
+        ]
+
+        yaml_strs = yaml_handler.serialize_many(originals)
+        restored = [
+            yaml_handler.deserialize(yaml_str, type(original)) for yaml_str, original in zip(yaml_strs, originals)
+        ]
+
+        assert restored == originals
+
 
 # =============================================================================
 # File Lifecycle Tests
@@ -321,25 +357,36 @@ class TestYAMLHandlerEdgeCases:
         assert len(conv.messages) == 1
         assert conv.archived is False
 
-    async def test_unicode_content_preserved(
+    @pytest.mark.parametrize(
+        "from_name,subject,body",
+        [
+            pytest.param("Tanaka Taro", None, "Hello World! Japanese: Test", id="plain"),
+            pytest.param("田中太郎", "件名 🎉", "こんにちは！Café résumé", id="unicode"),
+            pytest.param(
+                "Recruiter",
+                "RE: Position - $150K - 10% bonus",
+                "Terms: yes/no, true/false, null, ~, |, >, *, &, !, %, @, #",
+                id="special_yaml_characters",
+            ),
+        ],
+    )
+    async def test_message_content_preserved(
         self,
         tmp_path: Path,
         yaml_handler: YAMLHandler,
         fixed_datetime: Any,
+        from_name: str,
+        subject: Optional[str],
+        body: str,
     ) -> None:
-        """Test that Unicode content is preserved through save/load."""
-        message = Message(
-            timestamp=fixed_datetime,
-            from_name="Tanaka Taro",
-            body="Hello World! Japanese: Test",
-        )
-        file_path = tmp_path / "unicode.yaml"
+        """Test that Unicode and special YAML characters survive save/load."""
+        message = Message(timestamp=fixed_datetime, from_name=from_name, subject=subject, body=body)
+        file_path = tmp_path / "message.yaml"
 
         await yaml_handler.save(message, file_path)
         loaded = await yaml_handler.load(file_path, Message)
 
-        assert loaded.from_name == "Tanaka Taro"
-        assert "Japanese" in loaded.body
+        assert loaded == message
 
     async def test_multiline_message_body_preserved(
         self,
@@ -369,29 +416,6 @@ Recruiter"""
         assert loaded.body == multiline_body
         assert "\n\n" in loaded.body
 
-    async def test_special_yaml_characters_preserved(
-        self,
-        tmp_path: Path,
-        yaml_handler: YAMLHandler,
-        fixed_datetime: Any,
-    ) -> None:
-        """Test that special YAML characters are preserved."""
-        message = Message(
-            timestamp=fixed_datetime,
-            from_name="Recruiter",
-            subject="RE: Position - $150K - 10% bonus",
-            body="Terms: yes/no, true/false, null, ~, |, >, *, &, !, %, @, #",
-        )
-        file_path = tmp_path / "special_chars.yaml"
-
-        await yaml_handler.save(message, file_path)
-        loaded = await yaml_handler.load(file_path, Message)
-
-        assert loaded.subject is not None
-        assert "$150K" in loaded.subject
-        assert "yes/no" in loaded.body
-        assert "true/false" in loaded.body
-
     async def test_concurrent_save_with_file_locking(
         self,
         tmp_path: Path,
@@ -6,9 +6,10 @@ which is critical for the file-based storage system.
 
 from datetime import datetime
 from io import StringIO
-from typing import Any, Dict
+from typing import Any, Dict, Type, TypeVar, Union
 
 import pytest
+from pydantic import BaseModel
 from ruamel.yaml import YAML
 
 from app.models.analysis import ContextAnalysis, JobFitScore
@@ -17,78 +18,71 @@ from app.models.message import Message
 from app.models.metrics import ResponseMetrics
 from app.models.settings import UserSettings
 
+M = TypeVar("M", bound=BaseModel)
+
+
+# Built once per module: constructing a ruamel YAML instance resolves its
+# emitter/parser classes, which is wasted work when repeated for every call.
+# Loading uses the safe loader (libyaml-backed when ruamel.yaml.clib is
+# installed), matching YAMLHandler. The dumper is configured like YAMLHandler's
+# so these tests round-trip the same block-style layout production writes.
+_DUMPER = YAML()
+_DUMPER.preserve_quotes = True
+_DUMPER.default_flow_style = False
+_DUMPER.allow_unicode = True
+_DUMPER.width = 4096
+_LOADER = YAML(typ="safe")
+
 
 def _yaml_dump(data: Any) -> str:
     """Helper to dump data to YAML string using ruamel.yaml."""
-    yaml = YAML()
-    yaml.default_flow_style = False
-    yaml.allow_unicode = True
     stream = StringIO()
-    yaml.dump(data, stream)
+    _DUMPER.dump(data, stream)
     return stream.getvalue()
 
 
-def _yaml_load(yaml_str: str) -> Any:
-    """Helper to load data from YAML string using ruamel.yaml."""
-    yaml = YAML()
-    return yaml.load(StringIO(yaml_str))
+def _yaml_load(yaml_str: Union[str, bytes]) -> Any:
+    """Helper to load data from a YAML string or UTF-8 bytes using ruamel.yaml."""
+    return _LOADER.load(yaml_str)
+
+
+def _roundtrip(model_class: Type[M], instance: BaseModel) -> M:
+    """Dump a model to YAML in JSON mode and validate it back as model_class."""
+    return model_class.model_validate(_yaml_load(_yaml_dump(instance.model_dump(mode="json"))))
+
+
+@pytest.fixture(scope="module")
+def conversation_yaml_str(sample_conversation: Conversation) -> str:
+    """Provide sample_conversation dumped to YAML once for read-only round-trip tests."""
+    return _yaml_dump(sample_conversation.model_dump(mode="json"))
 
 
 @pytest.mark.integration
 class TestConversationYamlRoundTrip:
     """Test suite for Conversation YAML round-trip serialization."""
 
-    def test_conversation_to_yaml_and_back(self, sample_conversation_data: Dict[str, Any]) -> None:
+    def test_conversation_to_yaml_and_back(self, sample_conversation: Conversation, conversation_yaml_str: str) -> None:
         """Test Conversation serializes to YAML and deserializes correctly."""
-        original = Conversation(**sample_conversation_data)
+        original = sample_conversation
 
-        # Serialize to YAML
-        data = original.model_dump(mode="json")  # JSON-compatible format
-        yaml_str = _yaml_dump(data)
-
-        # Deserialize from YAML
-        loaded_data = _yaml_load(yaml_str)
-        restored = Conversation.model_validate(loaded_data)
+        restored = Conversation.model_validate(_yaml_load(conversation_yaml_str))
 
         assert restored.id == original.id
         assert restored.platform == original.platform
         assert restored.company == original.company
         assert restored.recruiter_name == original.recruiter_name
 
-    def test_conversation_yaml_preserves_datetime(self, sample_conversation_data: Dict[str, Any]) -> None:
-        """Test datetime fields survive YAML round-trip."""
-        original = Conversation(**sample_conversation_data)
-
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Conversation.model_validate(loaded_data)
-
-        # Timestamps should be preserved
-        assert restored.created_at.year == original.created_at.year
-        assert restored.created_at.month == original.created_at.month
-        assert restored.created_at.day == original.created_at.day
-
-    def test_conversation_yaml_preserves_uuid(self, sample_conversation_data: Dict[str, Any]) -> None:
-        """Test UUID field survives YAML round-trip."""
-        original = Conversation(**sample_conversation_data)
+    def test_conversation_yaml_preserves_field_types(
+        self, sample_conversation: Conversation, conversation_yaml_str: str
+    ) -> None:
+        """Test datetime, UUID and enum fields survive YAML round-trip."""
+        original = sample_conversation
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Conversation.model_validate(loaded_data)
+        restored = Conversation.model_validate(_yaml_load(conversation_yaml_str))
 
+        assert restored.created_at == original.created_at
+        assert restored.updated_at == original.updated_at
         assert restored.id == original.id
-
-    def test_conversation_yaml_preserves_enums(self, sample_conversation_data: Dict[str, Any]) -> None:
-        """Test enum fields survive YAML round-trip."""
-        original = Conversation(**sample_conversation_data)
-
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Conversation.model_validate(loaded_data)
-
         assert restored.platform == original.platform
         assert restored.process_status == original.process_status
 
@@ -104,19 +98,16 @@ class TestConversationYamlRoundTrip:
         }
         original = Conversation(**conv_data)
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Conversation.model_validate(loaded_data)
+        restored = _roundtrip(Conversation, original)
 
         assert restored.context_analysis is not None
         assert original.context_analysis is not None
         assert restored.context_analysis.summary == original.context_analysis.summary
         assert restored.context_analysis.sentiment_trend.initial == original.context_analysis.sentiment_trend.initial
 
-    def test_parse_existing_yaml_format(self, sample_yaml_conversation: str) -> None:
+    def test_parse_existing_yaml_format(self, sample_yaml_conversation_bytes: bytes) -> None:
         """Test parsing existing YAML format from SYSTEM-DESIGN."""
-        loaded_data = _yaml_load(sample_yaml_conversation)
+        loaded_data = _yaml_load(sample_yaml_conversation_bytes)
         conv = Conversation.model_validate(loaded_data)
 
         assert conv.id == "550e8400-e29b-41d4-a716-446655440000"
@@ -132,14 +123,11 @@ class TestConversationYamlRoundTrip:
 class TestMessageYamlRoundTrip:
     """Test suite for Message YAML round-trip serialization."""
 
-    def test_message_to_yaml_and_back(self, sample_message_data: Dict[str, Any]) -> None:
+    def test_message_to_yaml_and_back(self, sample_message: Message) -> None:
         """Test Message serializes to YAML and deserializes correctly."""
-        original = Message(**sample_message_data)
+        original = sample_message
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Message.model_validate(loaded_data)
+        restored = _roundtrip(Message, original)
 
         assert restored.from_name == original.from_name
         assert restored.to_name == original.to_name
@@ -165,19 +153,16 @@ Recruiter"""
             body=multiline_body,
         )
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Message.model_validate(loaded_data)
+        restored = _roundtrip(Message, original)
 
         assert restored.body == multiline_body
         assert "\n" in restored.body
         assert "Bullet points" in restored.body
 
-    def test_message_list_in_yaml(self, sample_message_data: Dict[str, Any], fixed_datetime: datetime) -> None:
+    def test_message_list_in_yaml(self, sample_message: Message, fixed_datetime: datetime) -> None:
         """Test list of messages serializes correctly to YAML."""
         messages = [
-            Message(**sample_message_data),
+            sample_message,
             Message(
                 timestamp=fixed_datetime,
                 from_name="Another Person",
@@ -199,28 +184,22 @@ Recruiter"""
 class TestAnalysisYamlRoundTrip:
     """Test suite for analysis models YAML round-trip."""
 
-    def test_context_analysis_yaml_round_trip(self, sample_context_analysis_data: Dict[str, Any]) -> None:
+    def test_context_analysis_yaml_round_trip(self, sample_context_analysis: ContextAnalysis) -> None:
         """Test ContextAnalysis YAML round-trip."""
-        original = ContextAnalysis(**sample_context_analysis_data)
+        original = sample_context_analysis
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = ContextAnalysis.model_validate(loaded_data)
+        restored = _roundtrip(ContextAnalysis, original)
 
         assert restored.summary == original.summary
         assert restored.sentiment_trend.initial == original.sentiment_trend.initial
         assert restored.conversation_stage.current == original.conversation_stage.current
         assert restored.patterns_detected == original.patterns_detected
 
-    def test_job_fit_score_yaml_round_trip(self, sample_job_fit_score_data: Dict[str, Any]) -> None:
+    def test_job_fit_score_yaml_round_trip(self, sample_job_fit_score: JobFitScore) -> None:
         """Test JobFitScore YAML round-trip."""
-        original = JobFitScore(**sample_job_fit_score_data)
+        original = sample_job_fit_score
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = JobFitScore.model_validate(loaded_data)
+        restored = _roundtrip(JobFitScore, original)
 
         assert restored.overall_score == original.overall_score
         assert restored.required_skills_score == original.required_skills_score
@@ -228,14 +207,11 @@ class TestAnalysisYamlRoundTrip:
         assert restored.gaps == original.gaps
         assert restored.breakdown == original.breakdown
 
-    def test_response_metrics_yaml_round_trip(self, sample_response_metrics_data: Dict[str, Any]) -> None:
+    def test_response_metrics_yaml_round_trip(self, sample_response_metrics: ResponseMetrics) -> None:
         """Test ResponseMetrics YAML round-trip."""
-        original = ResponseMetrics(**sample_response_metrics_data)
+        original = sample_response_metrics
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = ResponseMetrics.model_validate(loaded_data)
+        restored = _roundtrip(ResponseMetrics, original)
 
         assert restored.recruiter_avg_hours == original.recruiter_avg_hours
         assert restored.candidate_avg_hours == original.candidate_avg_hours
@@ -246,14 +222,11 @@ class TestAnalysisYamlRoundTrip:
 class TestUserSettingsYamlRoundTrip:
     """Test suite for UserSettings YAML round-trip."""
 
-    def test_user_settings_yaml_round_trip(self, sample_user_settings_data: Dict[str, Any]) -> None:
+    def test_user_settings_yaml_round_trip(self, sample_user_settings: UserSettings) -> None:
         """Test UserSettings YAML round-trip."""
-        original = UserSettings(**sample_user_settings_data)
+        original = sample_user_settings
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = UserSettings.model_validate(loaded_data)
+        restored = _roundtrip(UserSettings, original)
 
         assert restored.user_name == original.user_name
         assert restored.user_email == original.user_email
@@ -266,27 +239,14 @@ class TestUserSettingsYamlRoundTrip:
 class TestYamlSpecialCases:
     """Test suite for YAML special cases."""
 
-    def test_yaml_with_none_values(self, sample_conversation_minimal_data: Dict[str, Any]) -> None:
-        """Test YAML handles None values correctly."""
+    def test_yaml_with_none_values_and_empty_lists(self, sample_conversation_minimal_data: Dict[str, Any]) -> None:
+        """Test YAML handles None values and empty lists correctly."""
         original = Conversation(**sample_conversation_minimal_data)
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Conversation.model_validate(loaded_data)
+        restored = _roundtrip(Conversation, original)
 
         assert restored.company is None
         assert restored.context_analysis is None
-
-    def test_yaml_with_empty_lists(self, sample_conversation_minimal_data: Dict[str, Any]) -> None:
-        """Test YAML handles empty lists correctly."""
-        original = Conversation(**sample_conversation_minimal_data)
-
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Conversation.model_validate(loaded_data)
-
         assert restored.messages == []
         assert restored.context == []
 
@@ -298,10 +258,7 @@ class TestYamlSpecialCases:
             body="Hello! Are you interested?",
         )
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Message.model_validate(loaded_data)
+        restored = _roundtrip(Message, original)
 
         assert restored.from_name == "Tanaka Taro"
         assert "interested" in restored.body
@@ -315,10 +272,7 @@ class TestYamlSpecialCases:
             body="Terms: yes/no, true/false, null, ~, |, >, *, &, !, %, @, #",
         )
 
-        data = original.model_dump(mode="json")
-        yaml_str = _yaml_dump(data)
-        loaded_data = _yaml_load(yaml_str)
-        restored = Message.model_validate(loaded_data)
+        restored = _roundtrip(Message, original)
 
         assert restored.subject is not None
         assert "$150K" in restored.subject
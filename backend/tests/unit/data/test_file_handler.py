@@ -8,13 +8,23 @@ This module contains comprehensive tests for:
     - Error handling
 """
 
+import asyncio
+import errno
+import fnmatch
+import gc
+import os
+import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Type
 from unittest.mock import patch
 
 import pytest
 
 from app.core.exceptions import (
+    AppException,
     AppFileNotFoundError,
     DirectoryNotEmptyError,
     DirectoryNotFoundError,
@@ -22,7 +32,8 @@ from app.core.exceptions import (
     FileLockError,
     FileOperationError,
 )
-from app.data.file_handler import FileHandler, FileInfo, FileLock
+from app.data import file_handler as file_handler_module
+from app.data.file_handler import FileHandler, FileInfo, FileLock, OpenFile
 
 # =============================================================================
 # Fixtures
@@ -112,6 +123,70 @@ class TestFileHandlerRead:
         # Assert
         assert content == ""
 
+    async def test_read_file_translates_newlines(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test reading text translates CRLF and CR line endings to LF."""
+        # Arrange
+        test_file = tmp_path / "crlf.txt"
+        test_file.write_bytes(b"one\r\ntwo\rthree\n")
+
+        # Act
+        content = await file_handler.read_file(test_file)
+
+        # Assert
+        assert content == "one\ntwo\nthree\n"
+
+    async def test_read_bytes_keeps_line_endings(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test reading bytes returns content unchanged."""
+        # Arrange
+        test_file = tmp_path / "crlf.bin"
+        test_file.write_bytes(b"one\r\ntwo\r")
+
+        # Act
+        content = await file_handler.read_bytes(test_file)
+
+        # Assert
+        assert content == b"one\r\ntwo\r"
+
+    async def test_read_small_file_issues_single_read(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test a small file is read with one read call."""
+        # Arrange
+        test_file = tmp_path / "small.bin"
+        test_file.write_bytes(b"small content")
+
+        # Act
+        with patch("app.data.file_handler.os.read", wraps=os.read) as mock_read:
+            content = await file_handler.read_bytes(test_file)
+
+        # Assert
+        assert content == b"small content"
+        assert mock_read.call_count == 1
+
+    async def test_read_file_longer_than_reported_size(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test content beyond the fstat size (e.g. /proc files) is still read."""
+        # Arrange
+        test_file = tmp_path / "grown.bin"
+        test_file.write_bytes(b"abcdefgh")
+
+        # Act
+        with patch("app.data.file_handler.os.fstat", return_value=SimpleNamespace(st_size=2)):
+            content = await file_handler.read_bytes(test_file)
+
+        # Assert
+        assert content == b"abcdefgh"
+
+    async def test_read_large_file(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test files above the single-read threshold are read completely."""
+        # Arrange
+        test_file = tmp_path / "large.bin"
+        data = bytes(range(256)) * 1024
+        test_file.write_bytes(data)
+
+        # Act
+        content = await file_handler.read_bytes(test_file)
+
+        # Assert
+        assert content == data
+
     async def test_read_bytes_success(
         self, tmp_path: Path, file_handler: FileHandler, sample_bytes_content: bytes
     ) -> None:
@@ -238,6 +313,258 @@ class TestFileHandlerWrite:
         # Assert
         assert nested_file.exists()
 
+    async def test_write_file_large_unicode_content(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that content larger than one write chunk round-trips intact."""
+        # Arrange
+        test_file = tmp_path / "large_unicode.txt"
+        content = "日本語テキスト\n" * 20000  # spans many write chunks
+
+        # Act
+        await file_handler.write_file(test_file, content)
+
+        # Assert
+        assert test_file.read_text(encoding="utf-8") == content
+
+    async def test_write_many_writes_all_files(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test writing several files in one batch."""
+        # Arrange
+        items = [(tmp_path / "batch" / f"file_{i}.txt", f"content {i}") for i in range(5)]
+
+        # Act
+        await file_handler.write_many(items)
+
+        # Assert
+        for path, content in items:
+            assert path.read_text(encoding="utf-8") == content
+
+    async def test_write_many_propagates_errors(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that a failing write in the batch raises its mapped error."""
+        # Arrange
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory", encoding="utf-8")
+        items = [(tmp_path / "ok.txt", "ok"), (blocker / "child.txt", "fails")]
+
+        # Act & Assert
+        with pytest.raises(FileOperationError):
+            await file_handler.write_many(items)
+
+    async def test_write_file_issues_single_write(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test small text content is encoded once and written in one call."""
+        # Arrange
+        test_file = tmp_path / "single_write.txt"
+        content = "Line 1\nLine 2\nLine 3"
+
+        # Act
+        with patch("app.data.file_handler.os.write", wraps=os.write) as mock_write:
+            await file_handler.write_file(test_file, content)
+
+        # Assert
+        assert mock_write.call_count == 1
+        assert test_file.read_text(encoding="utf-8") == content
+
+    async def test_repeated_writes_create_parent_once(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that writes into a known directory skip the mkdir call."""
+        # Arrange
+        target_dir = tmp_path / "known"
+        original_mkdir = Path.mkdir
+
+        # Act
+        with patch.object(Path, "mkdir", autospec=True, side_effect=original_mkdir) as mock_mkdir:
+            for i in range(5):
+                await file_handler.write_file(target_dir / f"file_{i}.txt", "content")
+
+        # Assert
+        assert mock_mkdir.call_count == 1
+        assert len(list(target_dir.iterdir())) == 5
+
+    async def test_known_directories_cache_is_bounded(
+        self, tmp_path: Path, file_handler: FileHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the known-directory cache is reset once it reaches its limit."""
+        # Arrange
+        monkeypatch.setattr("app.data.file_handler._KNOWN_DIRS_LIMIT", 2)
+
+        # Act
+        for i in range(5):
+            await file_handler.write_file(tmp_path / f"dir_{i}" / "file.txt", "content")
+
+        # Assert
+        assert len(file_handler._known_dirs) <= 2
+        assert all((tmp_path / f"dir_{i}" / "file.txt").exists() for i in range(5))
+
+    async def test_write_after_delete_directory_recreates_parent(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test that delete_directory invalidates the known-directory cache."""
+        # Arrange
+        nested_file = tmp_path / "outer" / "inner" / "file.txt"
+        await file_handler.write_file(nested_file, "first")
+
+        # Act
+        await file_handler.delete_directory(tmp_path / "outer", recursive=True)
+        await file_handler.write_file(nested_file, "second")
+
+        # Assert
+        assert nested_file.read_text(encoding="utf-8") == "second"
+
+    async def test_delete_directory_forgets_entries_added_during_delete(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test that a directory cached by a write racing the delete is not left in the cache."""
+        # Arrange
+        target_dir = tmp_path / "racing"
+        original_rmtree = shutil.rmtree
+
+        def rmtree_after_concurrent_write(path: Path) -> None:
+            file_handler._ensure_directory(os.fspath(target_dir))
+            original_rmtree(path)
+
+        # Act
+        with patch("app.data.file_handler.shutil.rmtree", side_effect=rmtree_after_concurrent_write):
+            await file_handler.delete_directory(target_dir, recursive=True)
+
+        # Assert
+        assert not target_dir.exists()
+        assert os.path.normpath(target_dir) not in file_handler._known_dirs
+
+    async def test_write_after_external_directory_removal_recreates_parent(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test that a cached directory removed by another handler is recreated on the next write."""
+        # Arrange
+        nested_file = tmp_path / "outer" / "inner" / "file.txt"
+        nested_bytes = tmp_path / "outer" / "inner" / "file.bin"
+        await file_handler.write_file(nested_file, "first")
+        await FileHandler().delete_directory(tmp_path / "outer", recursive=True)
+
+        # Act
+        await file_handler.write_file(nested_file, "second")
+        shutil.rmtree(tmp_path / "outer")
+        await file_handler.write_bytes(nested_bytes, b"\x01")
+
+        # Assert
+        assert not nested_file.exists()
+        assert nested_bytes.read_bytes() == b"\x01"
+
+    async def test_ensure_directory_runs_off_event_loop(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that parent directories are created in a worker thread, not on the event loop."""
+        # Arrange
+        loop_thread = threading.get_ident()
+        mkdir_threads = []
+        original_mkdir = Path.mkdir
+
+        def record_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+            mkdir_threads.append(threading.get_ident())
+            original_mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        # Act
+        with patch.object(Path, "mkdir", autospec=True, side_effect=record_mkdir):
+            await file_handler.write_file(tmp_path / "new_dir" / "file.txt", "content")
+
+        # Assert
+        assert mkdir_threads
+        assert loop_thread not in mkdir_threads
+
+    async def test_write_and_read_accept_str_paths(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test read/write and existence checks accept plain string paths."""
+        # Arrange
+        text_path = os.path.join(str(tmp_path), "nested", "file.txt")
+        bytes_path = os.path.join(str(tmp_path), "nested", "file.bin")
+
+        # Act
+        await file_handler.write_file(text_path, "text content")
+        await file_handler.write_bytes(bytes_path, b"\x00\x01")
+
+        # Assert
+        assert await file_handler.read_file(text_path) == "text content"
+        assert await file_handler.read_bytes(bytes_path) == b"\x00\x01"
+        assert await file_handler.file_exists(text_path) is True
+        assert await file_handler.directory_exists(os.path.dirname(text_path)) is True
+
+    async def test_str_path_write_after_delete_directory(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test a non-normalized str parent is forgotten when its Path is deleted."""
+        # Arrange
+        outer = tmp_path / "outer"
+        unnormalized = str(tmp_path) + os.sep + "outer" + os.sep + os.sep + "file.txt"
+        await file_handler.write_file(unnormalized, "first")
+
+        # Act
+        await file_handler.delete_directory(outer, recursive=True)
+        await file_handler.write_file(unnormalized, "second")
+
+        # Assert
+        assert (outer / "file.txt").read_text(encoding="utf-8") == "second"
+
+
+# =============================================================================
+# Open File Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFileHandlerOpened:
+    """Test suite for FileHandler.opened() descriptor reuse."""
+
+    async def test_write_seek_read_on_one_descriptor(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test several operations share one open descriptor."""
+        # Arrange
+        test_file = tmp_path / "nested" / "data.bin"
+
+        # Act
+        async with file_handler.opened(test_file, "w+b") as f:
+            written = await f.write(b"hello world")
+            await f.seek(6)
+            tail = await f.read()
+            await f.seek(0)
+            head = await f.read(5)
+
+        # Assert
+        assert isinstance(f, OpenFile)
+        assert written == 11
+        assert (head, tail) == (b"hello", b"world")
+        assert test_file.read_bytes() == b"hello world"
+
+    async def test_append_mode(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test append mode writes after existing content."""
+        # Arrange
+        test_file = tmp_path / "append.bin"
+        test_file.write_bytes(b"abc")
+
+        # Act
+        async with file_handler.opened(test_file, "ab") as f:
+            await f.write(b"def")
+
+        # Assert
+        assert test_file.read_bytes() == b"abcdef"
+
+    async def test_descriptor_closed_on_exit(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test the descriptor is closed after the context exits."""
+        # Arrange
+        test_file = tmp_path / "closed.bin"
+        test_file.write_bytes(b"content")
+
+        # Act
+        with patch("app.data.file_handler.os.close", wraps=os.close) as mock_close:
+            async with file_handler.opened(test_file) as f:
+                pass
+
+        # Assert
+        mock_close.assert_called_once_with(f.fd)
+
+    async def test_missing_file_raises_not_found(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test opening a missing file for reading raises AppFileNotFoundError."""
+        # Act & Assert
+        with pytest.raises(AppFileNotFoundError):
+            async with file_handler.opened(tmp_path / "missing.bin"):
+                pass
+
+    async def test_unsupported_mode_raises_value_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test text modes are rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            async with file_handler.opened(tmp_path / "file.txt", "w"):
+                pass
+
 
 # =============================================================================
 # File Delete Tests
@@ -317,6 +644,129 @@ class TestFileHandlerExists:
         # Assert
         assert result is False
 
+    async def test_file_exists_runs_on_file_io_executor(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test blocking calls run on the shared file I/O executor threads."""
+        # Arrange
+        test_file = tmp_path / "threaded.txt"
+        test_file.write_text("content", encoding="utf-8")
+        real_isfile = os.path.isfile
+        thread_names = []
+
+        def recording_isfile(path: str) -> bool:
+            thread_names.append(threading.current_thread().name)
+            return real_isfile(path)
+
+        # Act
+        with patch("app.data.file_handler.os.path.isfile", side_effect=recording_isfile):
+            result = await file_handler.file_exists(test_file)
+
+        # Assert
+        assert result is True
+        assert len(thread_names) == 1
+        assert thread_names[0].startswith("file-io")
+
+    async def test_file_io_executor_is_recreated_after_shutdown(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test that the exit hook shuts the shared executor down and later calls start a new one."""
+        # Arrange
+        test_file = tmp_path / "after_shutdown.txt"
+        test_file.write_text("content", encoding="utf-8")
+        executor = file_handler_module._get_file_io_executor()
+
+        # Act
+        file_handler_module._shutdown_file_io_executor()
+        result = await file_handler.file_exists(test_file)
+
+        # Assert
+        assert result is True
+        assert executor._shutdown
+        assert file_handler_module._get_file_io_executor() is not executor
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_inherit_file_io_executor(self) -> None:
+        """Test that a forked child starts without the parent's executor."""
+        # Arrange
+        file_handler_module._get_file_io_executor()
+
+        # Act
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            os._exit(0 if file_handler_module._file_io_executor is None else 1)
+        _, status = os.waitpid(pid, 0)
+
+        # Assert
+        assert os.waitstatus_to_exitcode(status) == 0
+
+    async def test_files_exist_across_parents(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test files_exist reports each path across several parent directories."""
+        # Arrange
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        (first_dir / "a.txt").write_text("a", encoding="utf-8")
+        (first_dir / "b.txt").write_text("b", encoding="utf-8")
+        (first_dir / "sub").mkdir()
+        (second_dir / "c.txt").write_text("c", encoding="utf-8")
+        paths = [
+            first_dir / "a.txt",
+            first_dir / "b.txt",
+            first_dir / "missing.txt",
+            first_dir / "sub",
+            second_dir / "c.txt",
+            tmp_path / "no_such_dir" / "d.txt",
+            tmp_path / "no_such_dir" / "e.txt",
+        ]
+
+        # Act
+        result = await file_handler.files_exist(paths)
+
+        # Assert
+        assert result == {
+            first_dir / "a.txt": True,
+            first_dir / "b.txt": True,
+            first_dir / "missing.txt": False,
+            first_dir / "sub": False,
+            second_dir / "c.txt": True,
+            tmp_path / "no_such_dir" / "d.txt": False,
+            tmp_path / "no_such_dir" / "e.txt": False,
+        }
+
+    async def test_files_exist_matches_file_exists_on_case_insensitive_filesystem(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test a case-only name mismatch falls back to a stat, like file_exists."""
+        # Arrange - simulate a case-insensitive filesystem for the stat fallback
+        (tmp_path / "Report.txt").write_text("r", encoding="utf-8")
+        (tmp_path / "other.txt").write_text("o", encoding="utf-8")
+        real_isfile = os.path.isfile
+
+        def case_insensitive_isfile(path: "os.PathLike[str]") -> bool:
+            target = Path(path)
+            return any(
+                real_isfile(entry) for entry in target.parent.iterdir() if entry.name.lower() == target.name.lower()
+            )
+
+        paths = [tmp_path / "report.txt", tmp_path / "other.txt", tmp_path / "missing.txt"]
+
+        # Act
+        with patch("app.data.file_handler.os.path.isfile", side_effect=case_insensitive_isfile):
+            result = await file_handler.files_exist(paths)
+            single = await file_handler.file_exists(tmp_path / "report.txt")
+
+        # Assert
+        assert single is True
+        assert result == {tmp_path / "report.txt": True, tmp_path / "other.txt": True, tmp_path / "missing.txt": False}
+
+    async def test_files_exist_empty(self, file_handler: FileHandler) -> None:
+        """Test files_exist with no paths returns an empty mapping."""
+        # Act
+        result = await file_handler.files_exist([])
+
+        # Assert
+        assert result == {}
+
 
 # =============================================================================
 # Directory Tests
@@ -404,6 +854,19 @@ class TestFileHandlerDirectory:
         assert "file2.yaml" not in names
         assert len(contents) == 2
 
+    async def test_list_directory_with_literal_name(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test a pattern without wildcards matches only the exact name."""
+        # Arrange
+        (tmp_path / "config.yaml").write_text("content1", encoding="utf-8")
+        (tmp_path / "config.yaml.bak").write_text("content2", encoding="utf-8")
+        (tmp_path / "my_config.yaml").write_text("content3", encoding="utf-8")
+
+        # Act
+        contents = await file_handler.list_directory(tmp_path, pattern="config.yaml")
+
+        # Assert
+        assert contents == [tmp_path / "config.yaml"]
+
     async def test_list_directory_empty(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test listing an empty directory returns empty list."""
         # Arrange
@@ -427,6 +890,18 @@ class TestFileHandlerDirectory:
 
         assert exc_info.value.status_code == 404
 
+    async def test_list_directory_file_not_directory(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test list_directory raises DirectoryNotFoundError for a file."""
+        # Arrange
+        test_file = tmp_path / "not_a_directory.txt"
+        test_file.write_text("content", encoding="utf-8")
+
+        # Act & Assert
+        with pytest.raises(DirectoryNotFoundError) as exc_info:
+            await file_handler.list_directory(test_file)
+
+        assert "not a directory" in exc_info.value.message.lower()
+
     async def test_delete_empty_directory(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test deleting an empty directory."""
         # Arrange
@@ -468,6 +943,7 @@ class TestFileHandlerDirectory:
             await file_handler.delete_directory(non_empty_dir, recursive=False)
 
         assert exc_info.value.status_code == 409
+        assert (non_empty_dir / "file.txt").exists()
 
     async def test_delete_directory_not_found_returns_false(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test deleting non-existent directory returns False."""
@@ -480,6 +956,19 @@ class TestFileHandlerDirectory:
         # Assert
         assert result is False
 
+    async def test_delete_directory_recursive_not_found_returns_false(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test recursive delete of a non-existent directory returns False."""
+        # Arrange
+        non_existent = tmp_path / "does_not_exist"
+
+        # Act
+        result = await file_handler.delete_directory(non_existent, recursive=True)
+
+        # Assert
+        assert result is False
+
     async def test_directory_exists_returns_true(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test directory_exists returns True for existing directory."""
         # Arrange
@@ -570,6 +1059,114 @@ class TestFileHandlerInfo:
 
         assert exc_info.value.status_code == 404
 
+    async def test_get_file_info_single_stat(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test get_file_info derives all fields from one stat call."""
+        # Arrange
+        test_file = tmp_path / "one_stat.txt"
+        test_file.write_text("content", encoding="utf-8")
+        original_stat = Path.stat
+
+        # Act
+        with patch.object(Path, "stat", autospec=True, side_effect=original_stat) as mock_stat:
+            info = await file_handler.get_file_info(test_file)
+
+        # Assert
+        assert mock_stat.call_count == 1
+        assert info.is_file is True
+        assert info.size == len("content")
+
+    async def test_get_file_info_under_file_raises_not_found(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test a path below a regular file is reported as not found."""
+        # Arrange
+        test_file = tmp_path / "plain.txt"
+        test_file.write_text("content", encoding="utf-8")
+
+        # Act & Assert
+        with pytest.raises(AppFileNotFoundError):
+            await file_handler.get_file_info(test_file / "child")
+
+    async def test_get_file_info_reuses_cached_info(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test unchanged files return the cached FileInfo instance."""
+        # Arrange
+        test_file = tmp_path / "cached.txt"
+        test_file.write_text("content", encoding="utf-8")
+        first = await file_handler.get_file_info(test_file)
+
+        # Act
+        second = await file_handler.get_file_info(test_file)
+
+        # Assert
+        assert second is first
+
+    async def test_get_file_info_refreshes_after_change(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test a modified file is not served from the cache."""
+        # Arrange
+        test_file = tmp_path / "changed.txt"
+        test_file.write_text("short", encoding="utf-8")
+        first = await file_handler.get_file_info(test_file)
+        test_file.write_text("much longer content", encoding="utf-8")
+        # Guarantee a new mtime even on filesystems with coarse timestamps
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Act
+        second = await file_handler.get_file_info(test_file)
+
+        # Assert
+        assert second is not first
+        assert second.size == len("much longer content")
+
+    async def test_get_file_info_refreshes_on_size_change_within_timestamp_tick(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test a size change is detected even when mtime and ctime did not move (coarse timestamps)."""
+        # Arrange
+        test_file = tmp_path / "coarse.txt"
+        test_file.write_text("short", encoding="utf-8")
+        real = test_file.stat()
+        fields = ("st_mode", "st_ino", "st_mtime", "st_ctime", "st_mtime_ns", "st_ctime_ns")
+        before = SimpleNamespace(st_size=5, **{name: getattr(real, name) for name in fields})
+        after = SimpleNamespace(st_size=19, **{name: getattr(real, name) for name in fields})
+
+        # Act
+        with patch.object(Path, "stat", side_effect=[before, after]):
+            first = await file_handler.get_file_info(test_file)
+            second = await file_handler.get_file_info(test_file)
+
+        # Assert
+        assert first.size == 5
+        assert second.size == 19
+
+    async def test_get_cache_stats_counts_hits_and_misses(self, tmp_path: Path) -> None:
+        """Test cache counters track cold misses, hits and stale misses."""
+        # Arrange
+        handler = FileHandler(track_cache_stats=True)
+        test_file = tmp_path / "stats.txt"
+        test_file.write_text("content", encoding="utf-8")
+
+        # Act
+        await handler.get_file_info(test_file)
+        await handler.get_file_info(test_file)
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        await handler.get_file_info(test_file)
+
+        # Assert
+        assert handler.get_cache_stats() == {"hits": 1, "cold_misses": 1, "stale_misses": 1}
+
+    async def test_get_cache_stats_disabled_by_default(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test cache counters stay at zero unless tracking is enabled."""
+        # Arrange
+        test_file = tmp_path / "untracked.txt"
+        test_file.write_text("content", encoding="utf-8")
+
+        # Act
+        await file_handler.get_file_info(test_file)
+        await file_handler.get_file_info(test_file)
+
+        # Assert
+        assert file_handler.get_cache_stats() == {"hits": 0, "cold_misses": 0, "stale_misses": 0}
+
 
 # =============================================================================
 # File Locking Tests
@@ -629,6 +1226,27 @@ class TestFileHandlerLocking:
         # Cleanup
         await file_handler.release_lock(lock1)
 
+    async def test_release_wakes_waiting_acquire(
+        self, tmp_path: Path, file_handler: FileHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that releasing a lock wakes a waiter without waiting for the poll interval."""
+        # Arrange - make polling far slower than the assertion timeout
+        monkeypatch.setattr("app.data.file_handler._LOCK_POLL_INTERVAL", 60.0)
+        test_file = tmp_path / "wake_lock.txt"
+        lock1 = await file_handler.acquire_lock(test_file)
+        waiter = asyncio.create_task(file_handler.acquire_lock(test_file, timeout=30.0))
+        await asyncio.sleep(0.05)
+
+        # Act
+        await file_handler.release_lock(lock1)
+        lock2 = await asyncio.wait_for(waiter, timeout=2.0)
+
+        # Assert
+        assert lock2.path == test_file
+
+        # Cleanup
+        await file_handler.release_lock(lock2)
+
     async def test_lock_for_non_existent_file_creates_lock(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test acquiring lock for non-existent file creates lock file."""
         # Arrange
@@ -655,6 +1273,41 @@ class TestFileHandlerLocking:
         # Act & Assert (should not raise)
         await file_handler.release_lock(lock)
 
+    async def test_release_lock_ignores_waiters_on_closed_loops(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test that a waiter left behind by a closed event loop does not break release_lock."""
+        # Arrange
+        test_file = tmp_path / "closed_loop.txt"
+        lock = await file_handler.acquire_lock(test_file, timeout=1.0)
+        closed_loop = asyncio.new_event_loop()
+        orphaned_waiter = closed_loop.create_future()
+        closed_loop.close()
+        file_handler_module._lock_waiters.setdefault(lock.lock_file, set()).add(orphaned_waiter)
+
+        # Act
+        await file_handler.release_lock(lock)
+
+        # Assert
+        assert not lock.lock_file.exists()
+        assert lock.lock_file not in file_handler_module._lock_waiters
+
+    async def test_active_locks_do_not_pin_dropped_locks(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test a lock dropped without release is not kept alive by the handler."""
+        # Arrange
+        test_file = tmp_path / "dropped_lock.txt"
+        lock = await file_handler.acquire_lock(test_file)
+        assert file_handler._active_locks.get(test_file) is lock
+
+        # Act
+        lock_file = lock.lock_file
+        del lock
+        gc.collect()
+
+        # Assert
+        assert test_file not in file_handler._active_locks
+        lock_file.unlink()
+
     async def test_lock_released_on_exception(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test that lock is released when exception occurs in context manager."""
         # Arrange
@@ -763,201 +1416,125 @@ class TestFileHandlerErrors:
 # =============================================================================
 
 
+# Injected OS error and the AppException type FileHandler must translate it to
+_OS_ERROR_CASES = [
+    pytest.param(PermissionError("Access denied"), FileAccessError, id="permission"),
+    pytest.param(OSError("I/O error"), FileOperationError, id="os_error"),
+]
+
+
 @pytest.mark.unit
+@pytest.mark.parametrize("raised, expected", _OS_ERROR_CASES)
 class TestFileHandlerExceptionPaths:
     """Test suite for FileHandler exception handling paths."""
 
-    async def test_read_file_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test read_file raises FileAccessError on permission error."""
-        # Arrange
-        test_file = tmp_path / "permission_test.txt"
-        test_file.write_text("content", encoding="utf-8")
-
-        # Mock aiofiles.open to raise PermissionError
-        with patch("aiofiles.open", side_effect=PermissionError("Access denied")):
-            # Act & Assert
-            with pytest.raises(FileAccessError) as exc_info:
-                await file_handler.read_file(test_file)
-
-            assert "Permission denied" in exc_info.value.message
-
-    async def test_read_file_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test read_file raises FileOperationError on OS error."""
+    async def test_read_file_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test read_file translates OS errors."""
         # Arrange
-        test_file = tmp_path / "os_error_test.txt"
+        test_file = tmp_path / "read_error.txt"
         test_file.write_text("content", encoding="utf-8")
+        expected_message = "Permission denied" if expected is FileAccessError else "Error reading file"
 
-        # Mock aiofiles.open to raise OSError
-        with patch("aiofiles.open", side_effect=OSError("I/O error")):
+        with patch("app.data.file_handler.os.open", side_effect=raised):
             # Act & Assert
-            with pytest.raises(FileOperationError) as exc_info:
+            with pytest.raises(expected) as exc_info:
                 await file_handler.read_file(test_file)
 
-            assert "Error reading file" in exc_info.value.message
-
-    async def test_read_bytes_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test read_bytes raises FileAccessError on permission error."""
-        # Arrange
-        test_file = tmp_path / "permission_bytes.bin"
-        test_file.write_bytes(b"content")
+            assert expected_message in exc_info.value.message
 
-        with patch("aiofiles.open", side_effect=PermissionError("Access denied")):
-            with pytest.raises(FileAccessError):
-                await file_handler.read_bytes(test_file)
-
-    async def test_read_bytes_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test read_bytes raises FileOperationError on OS error."""
+    async def test_read_bytes_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test read_bytes translates OS errors."""
         # Arrange
-        test_file = tmp_path / "os_error_bytes.bin"
+        test_file = tmp_path / "read_error.bin"
         test_file.write_bytes(b"content")
 
-        with patch("aiofiles.open", side_effect=OSError("I/O error")):
-            with pytest.raises(FileOperationError):
+        with patch("app.data.file_handler.os.open", side_effect=raised):
+            with pytest.raises(expected):
                 await file_handler.read_bytes(test_file)
 
-    async def test_write_file_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test write_file raises FileAccessError on permission error."""
-        # Arrange
-        test_file = tmp_path / "permission_write.txt"
-
-        with patch("aiofiles.open", side_effect=PermissionError("Access denied")):
-            with pytest.raises(FileAccessError):
-                await file_handler.write_file(test_file, "content")
-
-    async def test_write_file_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test write_file raises FileOperationError on OS error."""
+    async def test_write_file_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test write_file translates OS errors."""
         # Arrange
-        test_file = tmp_path / "os_error_write.txt"
+        test_file = tmp_path / "write_error.txt"
 
-        with patch("aiofiles.open", side_effect=OSError("I/O error")):
-            with pytest.raises(FileOperationError):
+        with patch("app.data.file_handler.os.open", side_effect=raised):
+            with pytest.raises(expected):
                 await file_handler.write_file(test_file, "content")
 
-    async def test_write_bytes_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test write_bytes raises FileAccessError on permission error."""
-        # Arrange
-        test_file = tmp_path / "permission_write_bytes.bin"
-
-        with patch("aiofiles.open", side_effect=PermissionError("Access denied")):
-            with pytest.raises(FileAccessError):
-                await file_handler.write_bytes(test_file, b"content")
-
-    async def test_write_bytes_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test write_bytes raises FileOperationError on OS error."""
+    async def test_write_bytes_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test write_bytes translates OS errors."""
         # Arrange
-        test_file = tmp_path / "os_error_write_bytes.bin"
+        test_file = tmp_path / "write_error.bin"
 
-        with patch("aiofiles.open", side_effect=OSError("I/O error")):
-            with pytest.raises(FileOperationError):
+        with patch("app.data.file_handler.os.open", side_effect=raised):
+            with pytest.raises(expected):
                 await file_handler.write_bytes(test_file, b"content")
 
-    async def test_delete_file_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test delete_file raises FileAccessError on permission error."""
-        # Arrange
-        test_file = tmp_path / "permission_delete.txt"
-        test_file.write_text("content", encoding="utf-8")
-
-        with patch.object(Path, "unlink", side_effect=PermissionError("Access denied")):
-            with pytest.raises(FileAccessError):
-                await file_handler.delete_file(test_file)
-
-    async def test_delete_file_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test delete_file raises FileOperationError on OS error."""
+    async def test_delete_file_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test delete_file translates OS errors."""
         # Arrange
-        test_file = tmp_path / "os_error_delete.txt"
+        test_file = tmp_path / "delete_error.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch.object(Path, "unlink", side_effect=OSError("I/O error")):
-            with pytest.raises(FileOperationError):
+        with patch.object(Path, "unlink", side_effect=raised):
+            with pytest.raises(expected):
                 await file_handler.delete_file(test_file)
 
-    async def test_create_directory_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test create_directory raises FileAccessError on permission error."""
-        # Arrange
-        test_dir = tmp_path / "permission_mkdir"
-
-        with patch.object(Path, "mkdir", side_effect=PermissionError("Access denied")):
-            with pytest.raises(FileAccessError):
-                await file_handler.create_directory(test_dir)
-
-    async def test_create_directory_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test create_directory raises FileOperationError on OS error."""
+    async def test_create_directory_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test create_directory translates OS errors."""
         # Arrange
-        test_dir = tmp_path / "os_error_mkdir"
+        test_dir = tmp_path / "mkdir_error"
 
-        with patch.object(Path, "mkdir", side_effect=OSError("I/O error")):
-            with pytest.raises(FileOperationError):
+        with patch.object(Path, "mkdir", side_effect=raised):
+            with pytest.raises(expected):
                 await file_handler.create_directory(test_dir)
 
-    async def test_list_directory_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test list_directory raises FileAccessError on permission error."""
-        # Arrange
-        test_dir = tmp_path / "permission_list"
-        test_dir.mkdir()
-
-        with patch.object(Path, "glob", side_effect=PermissionError("Access denied")):
-            with pytest.raises(FileAccessError):
-                await file_handler.list_directory(test_dir)
-
-    async def test_list_directory_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test list_directory raises FileOperationError on OS error."""
+    async def test_list_directory_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test list_directory translates OS errors."""
         # Arrange
-        test_dir = tmp_path / "os_error_list"
+        test_dir = tmp_path / "list_error"
         test_dir.mkdir()
 
-        with patch.object(Path, "glob", side_effect=OSError("I/O error")):
-            with pytest.raises(FileOperationError):
+        with patch("app.data.file_handler.os.scandir", side_effect=raised):
+            with pytest.raises(expected):
                 await file_handler.list_directory(test_dir)
 
-    async def test_list_directory_file_not_directory(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test list_directory raises DirectoryNotFoundError for a file."""
-        # Arrange
-        test_file = tmp_path / "not_a_directory.txt"
-        test_file.write_text("content", encoding="utf-8")
-
-        with pytest.raises(DirectoryNotFoundError) as exc_info:
-            await file_handler.list_directory(test_file)
-
-        assert "not a directory" in exc_info.value.message.lower()
-
-    async def test_delete_directory_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test delete_directory raises FileAccessError on permission error."""
-        # Arrange
-        test_dir = tmp_path / "permission_rmdir"
-        test_dir.mkdir()
-
-        with patch.object(Path, "rmdir", side_effect=PermissionError("Access denied")):
-            with pytest.raises(FileAccessError):
-                await file_handler.delete_directory(test_dir)
-
-    async def test_delete_directory_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test delete_directory raises FileOperationError on OS error."""
+    async def test_delete_directory_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test delete_directory translates OS errors."""
         # Arrange
-        test_dir = tmp_path / "os_error_rmdir"
+        test_dir = tmp_path / "rmdir_error"
         test_dir.mkdir()
 
-        with patch.object(Path, "rmdir", side_effect=OSError("I/O error")):
-            with pytest.raises(FileOperationError):
+        with patch.object(Path, "rmdir", side_effect=raised):
+            with pytest.raises(expected):
                 await file_handler.delete_directory(test_dir)
 
-    async def test_get_file_info_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test get_file_info raises FileAccessError on permission error."""
-        # Arrange
-        test_file = tmp_path / "permission_info.txt"
-        test_file.write_text("content", encoding="utf-8")
-
-        with patch.object(Path, "stat", side_effect=PermissionError("Access denied")):
-            with pytest.raises(FileAccessError):
-                await file_handler.get_file_info(test_file)
-
-    async def test_get_file_info_os_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
-        """Test get_file_info raises FileOperationError on OS error."""
+    async def test_get_file_info_error(
+        self, tmp_path: Path, file_handler: FileHandler, raised: OSError, expected: Type[AppException]
+    ) -> None:
+        """Test get_file_info translates OS errors."""
         # Arrange
-        test_file = tmp_path / "os_error_info.txt"
+        test_file = tmp_path / "info_error.txt"
         test_file.write_text("content", encoding="utf-8")
 
-        with patch.object(Path, "stat", side_effect=OSError("I/O error")):
-            with pytest.raises(FileOperationError):
+        with patch.object(Path, "stat", side_effect=raised):
+            with pytest.raises(expected):
                 await file_handler.get_file_info(test_file)
 
 
@@ -970,46 +1547,40 @@ class TestFileHandlerExceptionPaths:
 class TestFileInfoValidation:
     """Test suite for FileInfo dataclass validation."""
 
-    def test_fileinfo_cannot_be_both_file_and_directory(self) -> None:
+    def test_fileinfo_cannot_be_both_file_and_directory(self, fixed_datetime: datetime) -> None:
         """Test that FileInfo raises ValueError when both is_file and is_directory are True."""
-        from datetime import datetime, timezone
-
         with pytest.raises(ValueError) as exc_info:
             FileInfo(
                 path=Path("/test"),
                 size=100,
-                created_at=datetime.now(timezone.utc),
-                modified_at=datetime.now(timezone.utc),
+                created_at=fixed_datetime,
+                modified_at=fixed_datetime,
                 is_file=True,
                 is_directory=True,
             )
 
         assert "cannot be both a file and a directory" in str(exc_info.value)
 
-    def test_fileinfo_can_be_file_only(self) -> None:
+    def test_fileinfo_can_be_file_only(self, fixed_datetime: datetime) -> None:
         """Test that FileInfo accepts is_file=True, is_directory=False."""
-        from datetime import datetime, timezone
-
         info = FileInfo(
             path=Path("/test.txt"),
             size=100,
-            created_at=datetime.now(timezone.utc),
-            modified_at=datetime.now(timezone.utc),
+            created_at=fixed_datetime,
+            modified_at=fixed_datetime,
             is_file=True,
             is_directory=False,
         )
         assert info.is_file is True
         assert info.is_directory is False
 
-    def test_fileinfo_can_be_directory_only(self) -> None:
+    def test_fileinfo_can_be_directory_only(self, fixed_datetime: datetime) -> None:
         """Test that FileInfo accepts is_file=False, is_directory=True."""
-        from datetime import datetime, timezone
-
         info = FileInfo(
             path=Path("/test_dir"),
             size=0,
-            created_at=datetime.now(timezone.utc),
-            modified_at=datetime.now(timezone.utc),
+            created_at=fixed_datetime,
+            modified_at=fixed_datetime,
             is_file=False,
             is_directory=True,
         )
@@ -1101,6 +1672,21 @@ class TestFileHandlerCopyMoveOperations:
         assert destination.read_text(encoding="utf-8") == content
         assert not source.exists()
 
+    async def test_move_file_into_existing_directory(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that moving onto an existing directory places the file inside it."""
+        # Arrange
+        source = tmp_path / "source.txt"
+        destination = tmp_path / "archive"
+        destination.mkdir()
+        source.write_text("Content to move", encoding="utf-8")
+
+        # Act
+        await file_handler.move_file(source, destination)
+
+        # Assert
+        assert (destination / "source.txt").read_text(encoding="utf-8") == "Content to move"
+        assert not source.exists()
+
     async def test_move_file_source_not_found(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test move_file raises error when source doesn't exist."""
         # Arrange
@@ -1168,6 +1754,120 @@ class TestGlobPatternValidation:
         file1_only = await file_handler.list_directory(test_dir, pattern="file1.*")
         assert len(file1_only) == 1
 
+    async def test_multi_component_glob_pattern(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that patterns with subdirectories and '**' still work."""
+        # Arrange
+        test_dir = tmp_path / "test_dir"
+        (test_dir / "sub").mkdir(parents=True)
+        (test_dir / "top.txt").write_text("content", encoding="utf-8")
+        (test_dir / "sub" / "nested.txt").write_text("content", encoding="utf-8")
+
+        # Act
+        nested = await file_handler.list_directory(test_dir, pattern="sub/*.txt")
+        recursive = await file_handler.list_directory(test_dir, pattern="**/*.txt")
+
+        # Assert
+        assert nested == [test_dir / "sub" / "nested.txt"]
+        assert sorted(p.name for p in recursive) == ["nested.txt", "top.txt"]
+
+    @pytest.mark.parametrize("pattern", ["*.txt", "**/*.txt"])
+    async def test_missing_directory_raises_for_any_pattern(
+        self, tmp_path: Path, file_handler: FileHandler, pattern: str
+    ) -> None:
+        """Test that scandir and pathlib listings report missing directories alike."""
+        with pytest.raises(DirectoryNotFoundError) as exc_info:
+            await file_handler.list_directory(tmp_path / "missing", pattern=pattern)
+
+        assert "Directory not found" in exc_info.value.message
+
+    @pytest.mark.parametrize("pattern", ["*.txt", "**/*.txt"])
+    async def test_file_path_raises_for_any_pattern(
+        self, tmp_path: Path, file_handler: FileHandler, pattern: str
+    ) -> None:
+        """Test that scandir and pathlib listings report non-directories alike."""
+        test_file = tmp_path / "file.txt"
+        test_file.write_text("content", encoding="utf-8")
+
+        with pytest.raises(DirectoryNotFoundError) as exc_info:
+            await file_handler.list_directory(test_file, pattern=pattern)
+
+        assert "not a directory" in exc_info.value.message
+
+    @pytest.mark.parametrize("pattern", ["*.txt", "file*", "*", "*.t*", "file?.txt", "data.json"])
+    async def test_glob_pattern_matches_fnmatch(self, tmp_path: Path, file_handler: FileHandler, pattern: str) -> None:
+        """Test that suffix/prefix fast paths agree with fnmatch semantics."""
+        # Arrange
+        test_dir = tmp_path / "test_dir"
+        test_dir.mkdir()
+        names = ["file1.txt", "file22.txt", "data.json", ".txt", "notes.txt.bak", "fileless"]
+        for name in names:
+            (test_dir / name).write_text("content", encoding="utf-8")
+
+        # Act
+        contents = await file_handler.list_directory(test_dir, pattern=pattern)
+
+        # Assert
+        assert sorted(p.name for p in contents) == sorted(fnmatch.filter(names, pattern))
+
+    async def test_character_class_glob_pattern(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that character classes match like pathlib.glob."""
+        # Arrange
+        test_dir = tmp_path / "test_dir"
+        test_dir.mkdir()
+        for name in ("file1.txt", "file2.txt", "file3.txt"):
+            (test_dir / name).write_text("content", encoding="utf-8")
+
+        # Act
+        contents = await file_handler.list_directory(test_dir, pattern="file[12].txt")
+
+        # Assert
+        assert sorted(p.name for p in contents) == ["file1.txt", "file2.txt"]
+
+    async def test_list_directory_grouped_matches_list_directory(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test that grouped listing returns the same results as per-pattern listing."""
+        # Arrange
+        test_dir = tmp_path / "test_dir"
+        (test_dir / "sub").mkdir(parents=True)
+        for name in ("a.txt", "b.yaml", "sub/c.txt"):
+            (test_dir / name).write_text("content", encoding="utf-8")
+        patterns = ["*.txt", "*.yaml", "*", "**/*.txt", "sub/*"]
+
+        # Act
+        grouped = await file_handler.list_directory_grouped(test_dir, patterns)
+
+        # Assert
+        assert list(grouped) == patterns
+        for pattern in patterns:
+            assert sorted(grouped[pattern]) == sorted(await file_handler.list_directory(test_dir, pattern))
+
+    async def test_list_directory_grouped_single_scan(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that simple patterns share one os.scandir pass."""
+        # Arrange
+        (tmp_path / "a.txt").write_text("content", encoding="utf-8")
+
+        # Act
+        with patch("app.data.file_handler.os.scandir", wraps=os.scandir) as mock_scandir:
+            await file_handler.list_directory_grouped(tmp_path, ["*.txt", "*.md", "a*"])
+
+        # Assert
+        assert mock_scandir.call_count == 1
+
+    async def test_list_directory_grouped_rejects_unsafe_pattern(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test that every pattern in the group is validated."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await file_handler.list_directory_grouped(tmp_path, ["*.txt", "../*"])
+
+    async def test_list_directory_grouped_missing_directory(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test that grouped listing of a missing directory raises DirectoryNotFoundError."""
+        # Act & Assert
+        with pytest.raises(DirectoryNotFoundError):
+            await file_handler.list_directory_grouped(tmp_path / "missing", ["*.txt"])
+
     async def test_glob_pattern_with_absolute_path_rejected(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test that glob patterns starting with '/' are rejected."""
         # Arrange
@@ -1247,7 +1947,7 @@ class TestCopyMovePermissionErrors:
         destination = tmp_path / "destination.txt"
         source.write_text("content", encoding="utf-8")
 
-        with patch("shutil.move", side_effect=PermissionError("Access denied")):
+        with patch("app.data.file_handler.os.replace", side_effect=PermissionError("Access denied")):
             with pytest.raises(FileAccessError) as exc_info:
                 await file_handler.move_file(source, destination)
 
@@ -1260,12 +1960,32 @@ class TestCopyMovePermissionErrors:
         destination = tmp_path / "destination.txt"
         source.write_text("content", encoding="utf-8")
 
-        with patch("shutil.move", side_effect=OSError("I/O error")):
+        with patch("app.data.file_handler.os.replace", side_effect=OSError("I/O error")):
             with pytest.raises(FileOperationError) as exc_info:
                 await file_handler.move_file(source, destination)
 
             assert "Error moving file" in exc_info.value.message
 
+    async def test_move_file_cross_device_falls_back_to_shutil_move(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test move_file copies via shutil.move when rename crosses filesystems."""
+        # Arrange
+        source = tmp_path / "source.txt"
+        destination = tmp_path / "destination.txt"
+        source.write_text("content", encoding="utf-8")
+        cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        # Act
+        with patch("app.data.file_handler.os.replace", side_effect=cross_device):
+            with patch("app.data.file_handler.shutil.move", wraps=shutil.move) as mock_move:
+                await file_handler.move_file(source, destination)
+
+        # Assert
+        mock_move.assert_called_once_with(str(source), str(destination))
+        assert not source.exists()
+        assert destination.read_text(encoding="utf-8") == "content"
+
     async def test_copy_file_mkdir_permission_error(self, tmp_path: Path, file_handler: FileHandler) -> None:
         """Test copy_file raises FileAccessError when mkdir fails with permission error."""
         # Arrange
@@ -1378,6 +2098,51 @@ class TestUnicodeDecodeError:
         assert "not valid UTF-8" in exc_info.value.message
         assert "encoding" in exc_info.value.details
 
+    async def test_read_large_invalid_file_fails_on_first_chunk(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test decoding a large file stops at the first undecodable chunk."""
+        # Arrange
+        test_file = tmp_path / "large_invalid.txt"
+        test_file.write_bytes(b"ok" + b"\xff" + b"a" * (3 * 1024 * 1024))
+
+        # Act
+        with patch("app.data.file_handler.os.read", wraps=os.read) as mock_read:
+            with pytest.raises(FileOperationError) as exc_info:
+                await file_handler.read_file(test_file)
+
+        # Assert
+        assert mock_read.call_count == 1
+        assert "at file offset 2" in exc_info.value.details["error"]
+
+    async def test_read_large_file_reports_absolute_offset(self, tmp_path: Path, file_handler: FileHandler) -> None:
+        """Test the error offset is relative to the file, not the chunk."""
+        # Arrange
+        test_file = tmp_path / "late_invalid.txt"
+        offset = 1024 * 1024 + 10
+        test_file.write_bytes(b"a" * offset + b"\xff" + b"a" * 100)
+
+        # Act & Assert
+        with pytest.raises(FileOperationError) as exc_info:
+            await file_handler.read_file(test_file)
+
+        assert f"at file offset {offset}" in exc_info.value.details["error"]
+
+    async def test_read_large_file_with_characters_across_chunks(
+        self, tmp_path: Path, file_handler: FileHandler
+    ) -> None:
+        """Test multi-byte characters split between read chunks decode correctly."""
+        # Arrange
+        test_file = tmp_path / "large_multibyte.txt"
+        content = "\u20ac" * 500_000 + "\r\nend"
+        test_file.write_bytes(content.encode("utf-8"))
+
+        # Act
+        result = await file_handler.read_file(test_file)
+
+        # Assert
+        assert result == "\u20ac" * 500_000 + "\nend"
+
 
 # =============================================================================
 # FileInfo Invalid State Tests
@@ -1388,16 +2153,14 @@ class TestUnicodeDecodeError:
 class TestFileInfoInvalidState:
     """Test suite for FileInfo invalid state validation."""
 
-    def test_fileinfo_cannot_be_neither_file_nor_directory(self) -> None:
+    def test_fileinfo_cannot_be_neither_file_nor_directory(self, fixed_datetime: datetime) -> None:
         """Test that FileInfo raises ValueError when both is_file and is_directory are False."""
-        from datetime import datetime, timezone
-
         with pytest.raises(ValueError) as exc_info:
             FileInfo(
                 path=Path("/test"),
                 size=100,
-                created_at=datetime.now(timezone.utc),
-                modified_at=datetime.now(timezone.utc),
+                created_at=fixed_datetime,
+                modified_at=fixed_datetime,
                 is_file=False,
                 is_directory=False,
             )
@@ -1414,24 +2177,20 @@ class TestFileInfoInvalidState:
 class TestFileLockComputedProperty:
     """Test suite for FileLock computed lock_file property."""
 
-    def test_lock_file_is_computed_from_path(self) -> None:
+    def test_lock_file_is_computed_from_path(self, fixed_datetime: datetime) -> None:
         """Test that lock_file is correctly computed from path."""
-        from datetime import datetime, timezone
-
         lock = FileLock(
             path=Path("/some/dir/myfile.txt"),
-            acquired_at=datetime.now(timezone.utc),
+            acquired_at=fixed_datetime,
         )
 
         assert lock.lock_file == Path("/some/dir/.myfile.txt.lock")
 
-    def test_lock_file_computation_consistent(self) -> None:
+    def test_lock_file_computation_consistent(self, fixed_datetime: datetime) -> None:
         """Test that lock_file computation is consistent across calls."""
-        from datetime import datetime, timezone
-
         lock = FileLock(
             path=Path("/test/file.yaml"),
-            acquired_at=datetime.now(timezone.utc),
+            acquired_at=fixed_datetime,
         )
 
         # Multiple calls should return the same value
@@ -208,6 +208,22 @@ metadata:
         assert result.items == ["item1", "item2"]
         assert result.metadata == {"key": "value"}
 
+    def test_deserialize_ignores_comments_and_returns_plain_types(self, yaml_handler: YAMLHandler) -> None:
+        """Test commented YAML loads into plain dict/list values."""
+        yaml_str = """
+# header comment
+title: Test Title  # trailing comment
+items:
+  - item1  # item comment
+metadata:
+  key: value
+"""
+        result = yaml_handler.deserialize(yaml_str, NestedModel)
+
+        assert result.items == ["item1"]
+        assert type(result.metadata) is dict
+        assert result.metadata == {"key": "value"}
+
     def test_deserialize_empty_yaml_with_defaults(self, yaml_handler: YAMLHandler) -> None:
         """Test deserializing empty YAML uses default values."""
         yaml_str = ""
@@ -499,6 +515,26 @@ class TestYAMLHandlerRoundTrip:
         assert restored.name == original.name
         assert "\n" in restored.name
 
+    def test_serialize_many_matches_serialize(self, yaml_handler: YAMLHandler) -> None:
+        """Test batched serialization yields one independent document per model."""
+        models = [SimpleModel(name="first", value=1), SimpleModel(name="a much longer second name", value=2)]
+
+        yaml_strs = yaml_handler.serialize_many(models)
+
+        assert yaml_strs == [yaml_handler.serialize(model) for model in models]
+
+    def test_deserialize_many_round_trip(self, yaml_handler: YAMLHandler) -> None:
+        """Test batched deserialization restores every model in order."""
+        originals = [SimpleModel(name=f"model {i}", value=i) for i in range(3)]
+
+        restored = yaml_handler.deserialize_many(yaml_handler.serialize_many(originals), SimpleModel)
+
+        assert restored == originals
+
+    def test_serialize_many_empty(self, yaml_handler: YAMLHandler) -> None:
+        """Test batched serialization of no models returns an empty list."""
+        assert yaml_handler.serialize_many([]) == []
+
 
 # =============================================================================
 # Configuration Tests
@@ -581,3 +581,71 @@ class TestConversationArchiveValidation:
         assert conv.archived is True
         assert conv.archived_at is not None
         assert conv.archive_reason is None
+
+
+@pytest.mark.unit
+class TestConversationTrustedMessages:
+    """Test suite for trusted-context message construction."""
+
+    def test_trusted_context_builds_messages(self, sample_conversation_data: Dict[str, Any]) -> None:
+        """Test that trusted input yields Message instances with parsed timestamps."""
+        data = {**sample_conversation_data, "messages": [{**sample_conversation_data["messages"][0]}]}
+        data["messages"][0]["timestamp"] = "2025-12-09T10:00:00Z"
+
+        conv = Conversation.model_validate(data, context={"trusted": True})
+
+        assert isinstance(conv.messages[0], Message)
+        assert conv.messages[0].timestamp == datetime(2025, 12, 9, 10, 0, 0, tzinfo=timezone.utc)
+        assert conv.messages[0].attachments == ("job_description.pdf",)
+
+    def test_trusted_context_still_rejects_traversal_attachments(self, fixed_datetime: datetime) -> None:
+        """Test that trusted input still confines attachment paths to the data directory."""
+        data = {
+            "platform": "linkedin",
+            "recruiter_name": "Test",
+            "messages": [{"timestamp": fixed_datetime, "from_name": "A", "body": "B", "attachments": ["../x"]}],
+        }
+
+        with pytest.raises(ValidationError):
+            Conversation.model_validate(data, context={"trusted": True})
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            {"from_name": "A", "body": "B"},
+            {"timestamp": "2025-12-09T10:00:00Z", "body": "B"},
+            {"timestamp": "2025-12-09T10:00:00Z", "from_name": "A"},
+            {"timestamp": "not a date", "from_name": "A", "body": "B"},
+            {"timestamp": "2025-12-09T10:00:00Z", "from_name": "A", "body": "B", "attachments": ""},
+            {"timestamp": "2025-12-09T10:00:00Z", "from_name": "A", "body": "B", "attachments": 0},
+        ],
+    )
+    def test_trusted_context_malformed_message_raises_validation_error(self, message: Dict[str, Any]) -> None:
+        """Test that malformed trusted messages fall back to regular validation."""
+        data = {"platform": "linkedin", "recruiter_name": "Test", "messages": [message]}
+
+        with pytest.raises(ValidationError):
+            Conversation.model_validate(data, context={"trusted": True})
+
+    def test_trusted_context_validates_unexpected_timestamp_type(self) -> None:
+        """Test that a non-string, non-datetime timestamp goes through regular validation."""
+        data = {
+            "platform": "linkedin",
+            "recruiter_name": "Test",
+            "messages": [{"timestamp": 0, "from_name": "A", "body": "B"}],
+        }
+
+        conv = Conversation.model_validate(data, context={"trusted": True})
+
+        assert conv.messages[0].timestamp == datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    def test_untrusted_input_validates_messages(self, fixed_datetime: datetime) -> None:
+        """Test that messages are validated without a trusted context."""
+        data = {
+            "platform": "linkedin",
+            "recruiter_name": "Test",
+            "messages": [{"timestamp": fixed_datetime, "from_name": "A", "body": "B", "attachments": ["../x"]}],
+        }
+
+        with pytest.raises(ValidationError):
+            Conversation.model_validate(data)
@@ -7,7 +7,7 @@ individual messages in a conversation with fields:
     - to_name (str, optional)
     - subject (str, optional)
     - body (str, required)
-    - attachments (List[str], default empty list)
+    - attachments (Tuple[str, ...], default empty tuple)
 """
 
 import json
@@ -33,7 +33,7 @@ class TestMessageCreation:
         assert message.to_name == sample_message_data["to_name"]
         assert message.subject == sample_message_data["subject"]
         assert message.body == sample_message_data["body"]
-        assert message.attachments == sample_message_data["attachments"]
+        assert message.attachments == tuple(sample_message_data["attachments"])
 
     def test_message_with_required_fields_only(self, sample_message_minimal_data: Dict[str, Any]) -> None:
         """Test creating Message with only required fields."""
@@ -44,7 +44,7 @@ class TestMessageCreation:
         assert message.body == sample_message_minimal_data["body"]
         assert message.to_name is None
         assert message.subject is None
-        assert message.attachments == []
+        assert message.attachments == ()
 
     def test_message_missing_timestamp_raises_error(self) -> None:
         """Test that missing timestamp raises ValidationError."""
@@ -85,23 +85,16 @@ class TestMessageDefaults:
         message = Message(**sample_message_minimal_data)
         assert message.subject is None
 
-    def test_attachments_defaults_to_empty_list(self, sample_message_minimal_data: Dict[str, Any]) -> None:
-        """Test that attachments defaults to empty list when not provided."""
+    def test_attachments_defaults_to_empty_tuple(self, sample_message_minimal_data: Dict[str, Any]) -> None:
+        """Test that attachments defaults to empty tuple when not provided."""
         message = Message(**sample_message_minimal_data)
-        assert message.attachments == []
-        assert isinstance(message.attachments, list)
+        assert message.attachments == ()
+        assert isinstance(message.attachments, tuple)
 
-    def test_attachments_default_is_new_list_per_instance(self, fixed_datetime: datetime) -> None:
-        """Test that attachments default creates new list per instance."""
-        message1 = Message(timestamp=fixed_datetime, from_name="Recruiter", body="Body 1")
-        message2 = Message(timestamp=fixed_datetime, from_name="Recruiter", body="Body 2")
-
-        # Modify one instance's attachments
-        message1.attachments.append("file.pdf")
-
-        # Ensure the other instance is not affected
-        assert message1.attachments == ["file.pdf"]
-        assert message2.attachments == []
+    def test_attachments_list_input_coerced_to_tuple(self, sample_message_data: Dict[str, Any]) -> None:
+        """Test that a list of attachments is stored as an immutable tuple."""
+        message = Message(**sample_message_data)
+        assert isinstance(message.attachments, tuple)
 
 
 @pytest.mark.unit
@@ -185,7 +178,7 @@ class TestMessageSerialization:
         assert data["to_name"] == sample_message_data["to_name"]
         assert data["subject"] == sample_message_data["subject"]
         assert data["body"] == sample_message_data["body"]
-        assert data["attachments"] == sample_message_data["attachments"]
+        assert data["attachments"] == tuple(sample_message_data["attachments"])
 
     def test_message_to_json(self, sample_message_data: Dict[str, Any]) -> None:
         """Test Message.model_dump_json() produces valid JSON."""
@@ -251,7 +244,7 @@ class TestMessageEdgeCases:
             body="Body",
             attachments=[],
         )
-        assert message.attachments == []
+        assert message.attachments == ()
 
     def test_message_with_very_long_body(self, fixed_datetime: datetime) -> None:
         """Test Message handles very long body text."""
@@ -305,3 +298,19 @@ class TestMessageEdgeCases:
             body="Body",
         )
         assert message.timestamp.year == 2025
+
+
+@pytest.mark.unit
+class TestMessageImmutability:
+    """Test suite for Message frozen (immutable) behavior."""
+
+    def test_message_is_frozen(self, sample_message_data: Dict[str, Any]) -> None:
+        """Test that Message fields cannot be reassigned."""
+        message = Message(**sample_message_data)
+        with pytest.raises(ValidationError) as exc_info:
+            message.body = "changed"  # type: ignore[misc]
+        assert "frozen" in str(exc_info.value).lower()
+
+    def test_message_is_hashable(self, sample_message_data: Dict[str, Any]) -> None:
+        """Test that equal messages de-duplicate in a set."""
+        assert len({Message(**sample_message_data), Message(**sample_message_data)}) == 1
@@ -6,6 +6,7 @@ data directory to prevent path traversal attacks.
 
 import os
 import tempfile
+from pathlib import Path
 from typing import Any, Generator
 from unittest.mock import patch
 
@@ -272,7 +273,7 @@ class TestMessageAttachmentsValidation:
             body="Test message",
             attachments=[],
         )
-        assert message.attachments == []
+        assert message.attachments == ()
 
 
 class TestPathValidationEdgeCases:
@@ -349,3 +350,24 @@ class TestPathValidationEdgeCases:
             resume_path="./resume.pdf",
         )
         assert settings.resume_path == "./resume.pdf"
+
+    def test_resume_path_rejects_symlink_escaping_data_dir(self, mock_settings: Any, tmp_path: Path) -> None:
+        """UserSettings.resume_path rejects paths that escape data_dir through a symlink."""
+        # Arrange
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "passwd").write_text("secret")
+        try:
+            os.symlink(outside, os.path.join(mock_settings.data_dir, "link"), target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported on this platform")
+
+        # Act & Assert
+        with pytest.raises(ValidationError) as exc_info:
+            UserSettings(
+                user_name="test",
+                user_email="test@example.com",
+                default_model="sonnet",
+                resume_path="link/passwd",
+            )
+        assert "outside allowed directory" in str(exc_info.value).lower()